@@ -32,7 +32,9 @@ def parse_league_ids_from_arg(league_id_arg: str) -> list[int]:
         [123, 456, 789]
     """
     try:
-        league_ids = [int(id_str.strip()) for id_str in league_id_arg.split(",") if id_str.strip()]
+        # int() ignores surrounding whitespace, so tokens are only stripped to
+        # skip empty entries such as "123,,456"
+        league_ids = [int(id_str) for id_str in league_id_arg.split(",") if id_str.strip()]
         if not league_ids:
             raise ValueError("No valid league IDs found")
         return league_ids
@@ -71,13 +73,13 @@ def parse_format_args(args_list: list[str] | None) -> dict[str, dict[str, str]]:
     result: dict[str, dict[str, str]] = {"_global": {}}
 
     for arg in args_list:
-        if "=" not in arg:
+        key, sep, value = arg.partition("=")
+        if not sep:
             raise ValueError(
                 f"Invalid format argument: '{arg}'. "
                 f"Must be in format: key=value or formatter.key=value"
             )
 
-        key, value = arg.split("=", 1)
         key = key.strip()
         value = value.strip()
 
@@ -85,17 +87,14 @@ def parse_format_args(args_list: list[str] | None) -> dict[str, dict[str, str]]:
             raise ValueError(f"Empty key in format argument: '{arg}'")
 
         # Check if formatter-specific (contains dot)
-        if "." in key:
-            parts = key.split(".", 1)
-            if len(parts) != 2 or not parts[0] or not parts[1]:
+        formatter, dot, arg_key = key.partition(".")
+        if dot:
+            if not formatter or not arg_key:
                 raise ValueError(
                     f"Invalid formatter-specific argument: '{arg}'. Must be: formatter.key=value"
                 )
 
-            formatter, arg_key = parts
-            if formatter not in result:
-                result[formatter] = {}
-            result[formatter][arg_key] = value
+            result.setdefault(formatter, {})[arg_key] = value
         else:
             # Global argument
             result["_global"][key] = value
@@ -11,13 +11,30 @@ This package provides formatters for different output formats:
 All formatters implement the BaseFormatter protocol for consistent interface.
 """
 
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .base import BaseFormatter, ReportContext, ReportMode
-from .console import ConsoleFormatter
-from .email import EmailFormatter
 from .factory import create_formatter, get_available_formats
-from .json import JsonFormatter
-from .markdown import MarkdownFormatter
-from .sheets import SheetsFormatter
+
+if TYPE_CHECKING:
+    from .console import ConsoleFormatter
+    from .email import EmailFormatter
+    from .json import JsonFormatter
+    from .markdown import MarkdownFormatter
+    from .sheets import SheetsFormatter
+
+# Formatter classes are imported on first attribute access so that importing
+# the package (e.g. for create_formatter) does not load every output format
+_LAZY_FORMATTERS = {
+    "ConsoleFormatter": "console",
+    "EmailFormatter": "email",
+    "JsonFormatter": "json",
+    "MarkdownFormatter": "markdown",
+    "SheetsFormatter": "sheets",
+}
 
 __all__ = [
     "BaseFormatter",
@@ -31,3 +48,11 @@ __all__ = [
     "create_formatter",
     "get_available_formats",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import formatter classes lazily on first access."""
+    module_name = _LAZY_FORMATTERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f".{module_name}", __name__), name)
@@ -7,10 +7,14 @@ maintaining consistency and extensibility.
 
 from __future__ import annotations
 
+import heapq
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+from importlib.metadata import PackageNotFoundError, version
+from itertools import chain
 from typing import Protocol
 
 from ..models import (
@@ -21,6 +25,42 @@ from ..models import (
     WeeklyChallenge,
 )
 from ..models.championship import ChampionshipRoster
+from ..models.division import _STANDINGS_KEY
+
+# Medal emoji for the top three championship ranks
+_RANK_MEDALS = {1: "🥇", 2: "🥈", 3: "🥉"}
+
+# Accepted (lowercased) spellings of a true boolean format argument
+_TRUE_VALUES = frozenset(("true", "1", "yes", "on"))
+
+
+@lru_cache(maxsize=1)
+def _package_version() -> str:
+    """Return the installed package version, resolved once per process."""
+    try:
+        return version("ff-awards")
+    except PackageNotFoundError:
+        # Running from a source checkout without installed package metadata
+        return "unknown"
+
+
+def _parse_bool_arg(value: str | None, default: bool = False) -> bool:
+    """
+    Interpret a format argument value as a boolean.
+
+    Shared by the weekly and season recap formatters so they accept the
+    same spellings: "true", "1", "yes", "on" (case-insensitive) are True.
+
+    Args:
+        value: Raw argument value, or None if not provided
+        default: Value to return when the argument was not provided
+
+    Returns:
+        Boolean value
+    """
+    if value is None:
+        return default
+    return value.lower() in _TRUE_VALUES
 
 
 class ReportMode(Enum):
@@ -172,10 +212,7 @@ class BaseFormatter(ABC):
         Returns:
             Boolean value
         """
-        value = self._get_arg(key)
-        if value is None:
-            return default
-        return value.lower() in ("true", "1", "yes", "on")
+        return _parse_bool_arg(self._get_arg(key), default)
 
     def _get_arg_int(self, key: str, default: int) -> int:
         """
@@ -250,17 +287,17 @@ class BaseFormatter(ABC):
 
     def _get_sorted_teams_by_division(self, division: DivisionData) -> list[TeamStats]:
         """Get teams sorted by wins (descending) then points for (descending)."""
-        return sorted(division.teams, key=lambda x: (x.wins, x.points_for), reverse=True)
+        # Copy so callers can't reorder the division's cached standings
+        return list(division.sorted_teams)
 
     def _get_overall_top_teams(
         self, divisions: Sequence[DivisionData], limit: int = 20
     ) -> list[TeamStats]:
         """Get top teams across all divisions."""
-        all_teams: list[TeamStats] = []
-        for division in divisions:
-            all_teams.extend(division.teams)
-
-        return sorted(all_teams, key=lambda x: (x.wins, x.points_for), reverse=True)[:limit]
+        # Partial selection: O(n log limit) rather than sorting every team
+        return heapq.nlargest(
+            limit, chain.from_iterable(division.teams for division in divisions), key=_STANDINGS_KEY
+        )
 
     def _calculate_total_stats(self, divisions: Sequence[DivisionData]) -> tuple[int, int]:
         """Calculate total number of divisions and teams."""
@@ -10,9 +10,15 @@ from collections.abc import Sequence
 
 from tabulate import tabulate
 
-from ..models import ChallengeResult, ChampionshipLeaderboard, DivisionData, WeeklyChallenge
+from ..models import (
+    ChallengeResult,
+    ChampionshipLeaderboard,
+    DivisionData,
+    WeeklyChallenge,
+    split_weekly_challenges,
+)
 from ..models.championship import ChampionshipRoster
-from .base import BaseFormatter
+from .base import _RANK_MEDALS, BaseFormatter
 
 
 class ConsoleFormatter(BaseFormatter):
@@ -204,7 +210,7 @@ class ConsoleFormatter(BaseFormatter):
                         matchup_name,
                         f"{matchup.team1_name} ({matchup.owner1_name})",
                         f"#{matchup.seed1}",
-                        f"{matchup.score1:.2f}" if matchup.score1 is not None else "TBD",
+                        matchup.score1_display,
                         team1_result,
                     ]
                 )
@@ -216,7 +222,7 @@ class ConsoleFormatter(BaseFormatter):
                         "",  # Empty matchup cell for second team
                         f"{matchup.team2_name} ({matchup.owner2_name})",
                         f"#{matchup.seed2}",
-                        f"{matchup.score2:.2f}" if matchup.score2 is not None else "TBD",
+                        matchup.score2_display,
                         team2_result,
                     ]
                 )
@@ -261,14 +267,7 @@ class ConsoleFormatter(BaseFormatter):
         leaderboard_table: list[list[str]] = []
         for entry in championship.entries:
             # Add medal emoji for top 3
-            if entry.rank == 1:
-                rank_display = "🥇"
-            elif entry.rank == 2:
-                rank_display = "🥈"
-            elif entry.rank == 3:
-                rank_display = "🥉"
-            else:
-                rank_display = str(entry.rank)
+            rank_display = _RANK_MEDALS.get(entry.rank) or str(entry.rank)
 
             leaderboard_table.append(
                 [
@@ -331,12 +330,12 @@ class ConsoleFormatter(BaseFormatter):
         # Championship week: show all challenges (all teams play)
         if is_championship_week:
             # Filter to only player challenges
-            return [c for c in weekly_challenges if "position" in c.additional_info]
+            return [c for c in weekly_challenges if c.is_player_highlight]
 
         # Semifinals/Finals: show only player highlights (only 4-6 teams playing)
         if is_playoff_mode:
             # Filter to only player challenges
-            return [c for c in weekly_challenges if "position" in c.additional_info]
+            return [c for c in weekly_challenges if c.is_player_highlight]
 
         # Regular season: show all challenges
         return list(weekly_challenges)
@@ -354,7 +353,7 @@ class ConsoleFormatter(BaseFormatter):
         player_table: list[list[str]] = []
         for challenge in player_challenges:
             # Show player name with position
-            position = challenge.additional_info.get("position", "")
+            position = challenge.position
             winner_display = f"{challenge.winner} ({position})"
             team_name = challenge.additional_info.get("team_name", "")
 
@@ -390,7 +389,7 @@ class ConsoleFormatter(BaseFormatter):
                     self._truncate_text(team.owner.full_name, 20),
                     f"{team.points_for:.2f}",
                     f"{team.points_against:.2f}",
-                    f"{team.wins}-{team.losses}",
+                    team.record,
                 ]
             )
 
@@ -419,7 +418,7 @@ class ConsoleFormatter(BaseFormatter):
                     self._truncate_text(team.division, 15),
                     f"{team.points_for:.2f}",
                     f"{team.points_against:.2f}",
-                    f"{team.wins}-{team.losses}",
+                    team.record,
                 ]
             )
 
@@ -453,8 +452,7 @@ class ConsoleFormatter(BaseFormatter):
     def _format_weekly_table(self, weekly_challenges: Sequence[WeeklyChallenge]) -> str:
         """Format the weekly challenges results table."""
         # Split into team and player challenges
-        team_challenges = [c for c in weekly_challenges if "position" not in c.additional_info]
-        player_challenges = [c for c in weekly_challenges if "position" in c.additional_info]
+        team_challenges, player_challenges = split_weekly_challenges(weekly_challenges)
 
         output_parts: list[str] = []
 
@@ -483,7 +481,7 @@ class ConsoleFormatter(BaseFormatter):
             player_table: list[list[str]] = []
             for challenge in player_challenges:
                 # Show player name with position
-                position = challenge.additional_info.get("position", "")
+                position = challenge.position
                 winner_display = f"{challenge.winner} ({position})"
 
                 player_table.append(
@@ -22,11 +22,16 @@ Template Injection Support:
 from __future__ import annotations
 
 from collections.abc import Sequence
-from importlib.metadata import version
 
-from ..models import ChallengeResult, ChampionshipLeaderboard, DivisionData, WeeklyChallenge
+from ..models import (
+    ChallengeResult,
+    ChampionshipLeaderboard,
+    DivisionData,
+    WeeklyChallenge,
+    split_weekly_challenges,
+)
 from ..models.championship import ChampionshipRoster
-from .base import BaseFormatter
+from .base import _RANK_MEDALS, BaseFormatter, _package_version
 
 
 class EmailFormatter(BaseFormatter):
@@ -322,15 +327,14 @@ class EmailFormatter(BaseFormatter):
         # Weekly player highlights (playoffs only show player challenges)
         if weekly_challenges and current_week and (is_playoff_mode or is_championship_week):
             # Filter to player challenges only
-            player_challenges = [c for c in weekly_challenges if "position" in c.additional_info]
+            player_challenges = [c for c in weekly_challenges if c.is_player_highlight]
             if player_challenges:
                 html_content += self._format_weekly_player_table(player_challenges, current_week)
 
         # Regular season weekly highlights (both team and player)
         elif weekly_challenges and current_week:
             # Split into team and player challenges
-            team_challenges = [c for c in weekly_challenges if "position" not in c.additional_info]
-            player_challenges = [c for c in weekly_challenges if "position" in c.additional_info]
+            team_challenges, player_challenges = split_weekly_challenges(weekly_challenges)
 
             html_content += '<div class="weekly-highlight">\n'
             html_content += f"<h2>🔥 Week {current_week} Highlights</h2>\n"
@@ -363,7 +367,7 @@ class EmailFormatter(BaseFormatter):
 
                 for challenge in player_challenges:
                     # Include position in player display
-                    position = challenge.additional_info.get("position", "")
+                    position = challenge.position
                     winner_display = f"{challenge.winner} ({position})"
 
                     html_content += (
@@ -433,7 +437,7 @@ class EmailFormatter(BaseFormatter):
                     f"<td>{self._escape_html(team.owner.full_name)}</td>"
                     f'<td class="number">{team.points_for:.2f}</td>'
                     f'<td class="number">{team.points_against:.2f}</td>'
-                    f"<td>{team.wins}-{team.losses}</td>"
+                    f"<td>{team.record}</td>"
                     f"</tr>\n"
                 )
 
@@ -463,7 +467,7 @@ class EmailFormatter(BaseFormatter):
                 f"<td>{self._escape_html(team.division)}</td>"
                 f'<td class="number">{team.points_for:.2f}</td>'
                 f'<td class="number">{team.points_against:.2f}</td>'
-                f"<td>{team.wins}-{team.losses}</td>"
+                f"<td>{team.record}</td>"
                 f"</tr>\n"
             )
 
@@ -481,7 +485,7 @@ class EmailFormatter(BaseFormatter):
         html_content += f"""
         <div class="footer">
             {game_data_text}<br>
-            <!-- GENERATED_METADATA_START --><!-- GENERATED_METADATA_END --><strong>Fantasy Football Challenge Tracker</strong> v{version("ff-awards")}<br>
+            <!-- GENERATED_METADATA_START --><!-- GENERATED_METADATA_END --><strong>Fantasy Football Challenge Tracker</strong> v{_package_version()}<br>
             <a href="https://github.com/shaunburdick/ff_awards" style="color: #3498db; text-decoration: none;">View on GitHub 🔗</a>
         </div>
 """
@@ -534,7 +538,7 @@ class EmailFormatter(BaseFormatter):
 
                 # Team 1
                 winner_class1 = " playoff-winner" if matchup.winner_seed == matchup.seed1 else ""
-                score1_display = f"{matchup.score1:.2f}" if matchup.score1 is not None else "TBD"
+                score1_display = matchup.score1_display
                 html_content += f'<table class="playoff-team{winner_class1}" cellpadding="10" cellspacing="0" border="0">\n'
                 html_content += "  <tr>\n"
                 html_content += f'    <td style="width: 75%; padding: 10px;">#{matchup.seed1} {self._escape_html(matchup.team1_name)} ({self._escape_html(matchup.owner1_name)})</td>\n'
@@ -544,7 +548,7 @@ class EmailFormatter(BaseFormatter):
 
                 # Team 2
                 winner_class2 = " playoff-winner" if matchup.winner_seed == matchup.seed2 else ""
-                score2_display = f"{matchup.score2:.2f}" if matchup.score2 is not None else "TBD"
+                score2_display = matchup.score2_display
                 html_content += f'<table class="playoff-team{winner_class2}" cellpadding="10" cellspacing="0" border="0">\n'
                 html_content += "  <tr>\n"
                 html_content += f'    <td style="width: 75%; padding: 10px;">#{matchup.seed2} {self._escape_html(matchup.team2_name)} ({self._escape_html(matchup.owner2_name)})</td>\n'
@@ -572,17 +576,12 @@ class EmailFormatter(BaseFormatter):
         html_content += '<tr><th>Rank</th><th>Team</th><th>Owner</th><th>Division</th><th class="number">Score</th></tr>\n'
 
         for entry in championship.entries:
-            medal = ""
-            if entry.rank == 1:
-                medal = "🥇 "
-            elif entry.rank == 2:
-                medal = "🥈 "
-            elif entry.rank == 3:
-                medal = "🥉 "
+            medal = _RANK_MEDALS.get(entry.rank)
+            medal_prefix = f"{medal} " if medal else ""
 
             html_content += (
                 f"<tr>"
-                f"<td>{medal}{entry.rank}</td>"
+                f"<td>{medal_prefix}{entry.rank}</td>"
                 f"<td>{self._escape_html(entry.team_name)}</td>"
                 f"<td>{self._escape_html(entry.owner_name)}</td>"
                 f"<td>{self._escape_html(entry.division_name)}</td>"
@@ -672,7 +671,7 @@ class EmailFormatter(BaseFormatter):
 
         for challenge in player_challenges:
             # Include position in player display
-            position = challenge.additional_info.get("position", "")
+            position = challenge.position
             winner_display = f"{challenge.winner} ({position})"
 
             html_content += (
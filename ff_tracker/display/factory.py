@@ -7,17 +7,35 @@ between main.py, championship.py, and season_recap.py.
 
 from __future__ import annotations
 
+from importlib import import_module
+
 from .base import BaseFormatter
-from .console import ConsoleFormatter
-from .email import EmailFormatter
-from .json import JsonFormatter
-from .markdown import MarkdownFormatter
-from .season_recap_console import SeasonRecapConsoleFormatter
-from .season_recap_email import SeasonRecapEmailFormatter
-from .season_recap_json import SeasonRecapJsonFormatter
-from .season_recap_markdown import SeasonRecapMarkdownFormatter
-from .season_recap_sheets import SeasonRecapSheetsFormatter
-from .sheets import SheetsFormatter
+
+# Formatter name -> (submodule, class name). Submodules are imported on first
+# use so a single-format run only loads the formatter it renders with.
+_FORMATTERS: dict[str, tuple[str, str]] = {
+    "console": ("console", "ConsoleFormatter"),
+    "sheets": ("sheets", "SheetsFormatter"),
+    "email": ("email", "EmailFormatter"),
+    "json": ("json", "JsonFormatter"),
+    "markdown": ("markdown", "MarkdownFormatter"),
+}
+
+_SEASON_RECAP_FORMATTERS: dict[str, tuple[str, str]] = {
+    "console": ("season_recap_console", "SeasonRecapConsoleFormatter"),
+    "json": ("season_recap_json", "SeasonRecapJsonFormatter"),
+    "sheets": ("season_recap_sheets", "SeasonRecapSheetsFormatter"),
+    "markdown": ("season_recap_markdown", "SeasonRecapMarkdownFormatter"),
+    "email": ("season_recap_email", "SeasonRecapEmailFormatter"),
+}
+
+
+def _load_formatter_class(module_name: str, class_name: str) -> type[BaseFormatter]:
+    """Import a display submodule and return the named formatter class."""
+    formatter_class: type[BaseFormatter] = getattr(
+        import_module(f".{module_name}", __package__), class_name
+    )
+    return formatter_class
 
 
 def create_formatter(
@@ -46,20 +64,12 @@ def create_formatter(
         >>> formatter = create_formatter("console", 2024)
         >>> formatter = create_formatter("email", 2024, {"accent_color": "#007bff"})
     """
-    formatters = {
-        "console": ConsoleFormatter,
-        "sheets": SheetsFormatter,
-        "email": EmailFormatter,
-        "json": JsonFormatter,
-        "markdown": MarkdownFormatter,
-    }
-
-    formatter_class = formatters.get(format_name)
-    if not formatter_class:
-        valid_formats = ", ".join(formatters.keys())
+    entry = _FORMATTERS.get(format_name)
+    if not entry:
+        valid_formats = ", ".join(_FORMATTERS.keys())
         raise ValueError(f"Unknown format: {format_name}. Valid formats: {valid_formats}")
 
-    return formatter_class(year, format_args)
+    return _load_formatter_class(*entry)(year, format_args)
 
 
 def get_available_formats() -> list[str]:
@@ -74,7 +84,7 @@ def get_available_formats() -> list[str]:
         >>> print(formats)
         ['console', 'sheets', 'email', 'json', 'markdown']
     """
-    return ["console", "sheets", "email", "json", "markdown"]
+    return list(_FORMATTERS)
 
 
 def create_season_recap_formatter(
@@ -103,19 +113,11 @@ def create_season_recap_formatter(
         >>> formatter = create_season_recap_formatter("console", 2024)
         >>> formatter = create_season_recap_formatter("email", 2024, {"accent_color": "#007bff"})
     """
-    formatters = {
-        "console": SeasonRecapConsoleFormatter,
-        "json": SeasonRecapJsonFormatter,
-        "sheets": SeasonRecapSheetsFormatter,
-        "markdown": SeasonRecapMarkdownFormatter,
-        "email": SeasonRecapEmailFormatter,
-    }
-
-    formatter_class = formatters.get(format_name)
-    if not formatter_class:
-        valid_formats = ", ".join(formatters.keys())
+    entry = _SEASON_RECAP_FORMATTERS.get(format_name)
+    if not entry:
+        valid_formats = ", ".join(_SEASON_RECAP_FORMATTERS.keys())
         raise ValueError(
             f"Unknown season recap format: {format_name}. Valid formats: {valid_formats}"
         )
 
-    return formatter_class(year, format_args)
+    return _load_formatter_class(*entry)(year, format_args)
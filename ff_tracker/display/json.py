@@ -94,18 +94,14 @@ class JsonFormatter(BaseFormatter):
             # Filter to player challenges only in playoff mode
             filtered_challenges = weekly_challenges
             if is_playoff_mode or is_championship_week:
-                filtered_challenges = [
-                    c for c in weekly_challenges if "position" in c.additional_info
-                ]
+                filtered_challenges = [c for c in weekly_challenges if c.is_player_highlight]
 
             data["weekly_player_highlights"] = [
                 {
                     "challenge_name": challenge.challenge_name,
-                    "challenge_type": "player"
-                    if "position" in challenge.additional_info
-                    else "team",
+                    "challenge_type": "player" if challenge.is_player_highlight else "team",
                     "player_name": challenge.winner,
-                    "position": challenge.additional_info.get("position", ""),
+                    "position": challenge.position,
                     "fantasy_team": challenge.additional_info.get("team_name", ""),
                     "division": challenge.division,
                     "points": float(challenge.value)
@@ -147,7 +143,7 @@ class JsonFormatter(BaseFormatter):
                                 "rank": i,
                                 "team_name": team.name,
                                 "owner_name": team.owner.full_name,
-                                "record": f"{team.wins}-{team.losses}",
+                                "record": team.record,
                                 "points_for": team.points_for,
                                 "points_against": team.points_against,
                                 "playoff_status": "qualified"
@@ -9,9 +9,59 @@ from __future__ import annotations
 
 from collections.abc import Sequence
 
-from ..models import ChallengeResult, ChampionshipLeaderboard, DivisionData, WeeklyChallenge
+from ..models import (
+    ChallengeResult,
+    ChampionshipLeaderboard,
+    DivisionData,
+    WeeklyChallenge,
+    split_weekly_challenges,
+)
 from ..models.championship import ChampionshipRoster
-from .base import BaseFormatter
+from .base import _RANK_MEDALS, BaseFormatter
+
+# Escaped asterisk marking teams currently in playoff position
+_PLAYOFF_PREFIX = "\\* "
+
+# Horizontal rule separating report sections, padded by blank lines
+_HR_BLOCK = ("", "---", "")
+
+# Static table headers (header row + separator row)
+_PLAYOFF_BRACKET_HEADER = (
+    "| Matchup | Team (Owner) | Seed | Score | Result |",
+    "|---------|--------------|------|-------|--------|",
+)
+_CHAMPIONSHIP_HEADER = (
+    "| Rank | Team (Owner) | Division Champion | Final Score |",
+    "|------|--------------|-------------------|-------------|",
+)
+_ROSTER_STARTERS_HEADER = (
+    "| Status | Pos | Player | Team | Points |",
+    "|--------|-----|--------|------|--------|",
+)
+_WEEKLY_PLAYOFF_PLAYER_HEADER = (
+    "| Challenge | Player (Position) | Team | Points |",
+    "|-----------|-------------------|------|--------|",
+)
+_DIVISION_HEADER = (
+    "| Rank | Team | Owner | Points For | Points Against | Record |",
+    "|------|------|-------|------------|----------------|--------|",
+)
+_OVERALL_HEADER = (
+    "| Rank | Team | Owner | Division | Points For | Points Against | Record |",
+    "|------|------|-------|----------|------------|----------------|--------|",
+)
+_CHALLENGE_HEADER = (
+    "| Challenge | Winner | Owner | Division | Details |",
+    "|-----------|--------|-------|----------|---------|",
+)
+_WEEKLY_TEAM_HEADER = (
+    "| Challenge | Team | Division | Value |",
+    "|-----------|------|----------|-------|",
+)
+_WEEKLY_PLAYER_HEADER = (
+    "| Challenge | Player | Points |",
+    "|-----------|--------|--------|",
+)
 
 
 class MarkdownFormatter(BaseFormatter):
@@ -27,6 +77,9 @@ class MarkdownFormatter(BaseFormatter):
         """
         super().__init__(year, format_args)
 
+        self._note = self._get_arg("note")
+        self._include_toc = self._get_arg_bool("include_toc", False)
+
     @classmethod
     def get_supported_args(cls) -> dict[str, str]:
         """Return supported format arguments for markdown formatter."""
@@ -45,20 +98,18 @@ class MarkdownFormatter(BaseFormatter):
         championship_rosters: Sequence[ChampionshipRoster] | None = None,
     ) -> str:
         """Format complete output for Markdown display."""
-        # Get format arguments
-        note = self._get_arg("note")
-        include_toc = self._get_arg_bool("include_toc", False)
+        note = self._note
+        include_toc = self._include_toc
 
-        # Detect playoff mode
-        is_playoff_mode = any(d.is_playoff_mode for d in divisions)
+        # Detect playoff mode (championship week always implies playoffs, so skip the scan)
         is_championship_week = championship is not None
+        is_playoff_mode = is_championship_week or any(d.is_playoff_mode for d in divisions)
 
         output_lines: list[str] = []
 
         # Header with playoff styling
         if is_championship_week:
-            output_lines.append("# 🏆 CHAMPIONSHIP WEEK 🏆")
-            output_lines.append("## HIGHEST SCORE WINS OVERALL!")
+            output_lines.extend(("# 🏆 CHAMPIONSHIP WEEK 🏆", "## HIGHEST SCORE WINS OVERALL!"))
         elif is_playoff_mode:
             playoff_round = (
                 divisions[0].playoff_bracket.round if divisions[0].playoff_bracket else "PLAYOFFS"
@@ -66,12 +117,12 @@ class MarkdownFormatter(BaseFormatter):
             output_lines.append(f"# 🏈 {playoff_round.upper()} 🏈")
         else:
             total_divisions, total_teams = self._calculate_total_stats(divisions)
-            output_lines.append(
-                f"# 🏈 Fantasy Football Multi-Division Challenge Tracker ({self.year})"
-            )
-            output_lines.append("")
-            output_lines.append(
-                f"📊 **{total_divisions} divisions**, **{total_teams} teams total**"
+            output_lines.extend(
+                (
+                    f"# 🏈 Fantasy Football Multi-Division Challenge Tracker ({self.year})",
+                    "",
+                    f"📊 **{total_divisions} divisions**, **{total_teams} teams total**",
+                )
             )
 
         if current_week is not None:
@@ -81,17 +132,15 @@ class MarkdownFormatter(BaseFormatter):
 
         # Optional note
         if note:
-            output_lines.append(f"> ⚠️ **{note}**")
-            output_lines.append("")
+            output_lines.extend((f"> ⚠️ **{note}**", ""))
 
         # Skip TOC in playoff mode for simplicity
         if include_toc and not is_playoff_mode:
-            output_lines.append("## 📋 Table of Contents")
-            output_lines.append("")
-            for division in divisions:
-                output_lines.append(
-                    f"- [{division.name} Standings](#{division.name.lower().replace(' ', '-')}-standings)"
-                )
+            output_lines.extend(("## 📋 Table of Contents", ""))
+            output_lines.extend(
+                f"- [{division.name} Standings](#{division.slug}-standings)"
+                for division in divisions
+            )
             output_lines.append("- [Overall Top Teams](#-overall-top-teams-across-all-divisions)")
             if challenges:
                 output_lines.append("- [Season Challenge Results](#-season-challenge-results)")
@@ -103,88 +152,65 @@ class MarkdownFormatter(BaseFormatter):
 
         # PLAYOFF MODE: Championship leaderboard FIRST
         if is_championship_week and championship:
-            championship_output = self._format_championship_leaderboard(
-                championship, championship_rosters
+            output_lines.extend(
+                self._championship_leaderboard_lines(championship, championship_rosters)
             )
-            output_lines.append(championship_output)
-            output_lines.append("")
             # Add detailed rosters if available
             if championship_rosters:
-                rosters_output = self._format_championship_rosters(championship_rosters)
-                output_lines.append(rosters_output)
                 output_lines.append("")
-            output_lines.append("---")
-            output_lines.append("")
+                output_lines.extend(self._championship_roster_lines(championship_rosters))
+            output_lines.extend(_HR_BLOCK)
 
         # PLAYOFF MODE: Playoff brackets FIRST
         if is_playoff_mode and not is_championship_week:
-            playoff_output = self._format_playoff_brackets(divisions)
-            output_lines.append(playoff_output)
-            output_lines.append("---")
-            output_lines.append("")
+            output_lines.extend(self._playoff_bracket_lines(divisions))
+            output_lines.extend(("---", ""))
 
         # Weekly challenges (filter for playoffs)
         if weekly_challenges and current_week:
-            filtered_challenges = [c for c in weekly_challenges if "position" in c.additional_info]
-            if filtered_challenges and (is_playoff_mode or is_championship_week):
-                output_lines.append(f"# 🌟 WEEKLY PLAYER HIGHLIGHTS - WEEK {current_week} 🌟")
-                output_lines.append("")
-                player_table = self._format_weekly_player_table(filtered_challenges)
-                output_lines.append(player_table)
-                output_lines.append("")
+            team_challenges, player_challenges = split_weekly_challenges(weekly_challenges)
+            if player_challenges and (is_playoff_mode or is_championship_week):
+                output_lines.extend((f"# 🌟 WEEKLY PLAYER HIGHLIGHTS - WEEK {current_week} 🌟", ""))
+                output_lines.extend(self._weekly_player_table_lines(player_challenges))
                 if is_championship_week:
-                    output_lines.append(
-                        "_Note: Player highlights include all players across all teams._"
+                    output_lines.extend(
+                        ("", "_Note: Player highlights include all players across all teams._")
                     )
-                    output_lines.append("")
-                output_lines.append("---")
-                output_lines.append("")
+                output_lines.extend(_HR_BLOCK)
             elif not is_playoff_mode:
                 # Regular season: show all challenges
-                output_lines.append(f"## 🔥 WEEK {current_week} HIGHLIGHTS")
-                output_lines.append("")
-                weekly_table = self._format_weekly_table(weekly_challenges)
-                output_lines.append(weekly_table)
+                output_lines.extend((f"## 🔥 WEEK {current_week} HIGHLIGHTS", ""))
+                output_lines.extend(self._weekly_table_lines(team_challenges, player_challenges))
                 output_lines.append("")
 
         # Season challenges (with historical note if in playoffs)
         if challenges:
+            challenge_lines = self._challenge_table_lines(challenges)
             if is_playoff_mode:
-                output_lines.append("# 📊 REGULAR SEASON FINAL RESULTS (Historical) 📊")
+                output_lines.extend(("# 📊 REGULAR SEASON FINAL RESULTS (Historical) 📊", ""))
+                output_lines.extend(challenge_lines)
+                output_lines.extend(_HR_BLOCK)
             else:
-                output_lines.append("## 💰 OVERALL SEASON CHALLENGES")
-            output_lines.append("")
-            challenge_table = self._format_challenge_table(challenges)
-            output_lines.append(challenge_table)
-            output_lines.append("")
-            if is_playoff_mode:
-                output_lines.append("---")
+                output_lines.extend(("## 💰 OVERALL SEASON CHALLENGES", ""))
+                output_lines.extend(challenge_lines)
                 output_lines.append("")
 
         # Regular season standings (LAST in playoff mode, or skip in championship)
         if not is_championship_week:
             if is_playoff_mode:
-                output_lines.append("## FINAL REGULAR SEASON STANDINGS")
-                output_lines.append("")
+                output_lines.extend(("## FINAL REGULAR SEASON STANDINGS", ""))
             for division in divisions:
-                output_lines.append(f"### {division.name}")
-                output_lines.append("")
-                division_table = self._format_division_table(division)
-                output_lines.append(division_table)
+                output_lines.extend((f"### {division.name}", ""))
+                output_lines.extend(self._division_table_lines(division))
                 output_lines.append("")
                 if not is_playoff_mode:
-                    output_lines.append("_\\* = Currently in playoff position_")
-                    output_lines.append("")
+                    output_lines.extend(("_\\* = Currently in playoff position_", ""))
 
             # Overall top teams (only if not in playoffs)
             if not is_playoff_mode:
-                output_lines.append("## 🌟 OVERALL TOP TEAMS (Across All Divisions)")
-                output_lines.append("")
-                overall_table = self._format_overall_table(divisions)
-                output_lines.append(overall_table)
-                output_lines.append("")
-                output_lines.append("_\\* = Currently in playoff position_")
-                output_lines.append("")
+                output_lines.extend(("## 🌟 OVERALL TOP TEAMS (Across All Divisions)", ""))
+                output_lines.extend(self._overall_table_lines(divisions))
+                output_lines.extend(("", "_\\* = Currently in playoff position_", ""))
 
         # Game data summary (only in regular season)
         if challenges and not is_playoff_mode:
@@ -196,15 +222,15 @@ class MarkdownFormatter(BaseFormatter):
 
         return "\n".join(output_lines)
 
-    def _format_playoff_brackets(self, divisions: Sequence[DivisionData]) -> str:
+    def _playoff_bracket_lines(self, divisions: Sequence[DivisionData]) -> list[str]:
         """
-        Format playoff brackets for all divisions in Markdown.
+        Build playoff bracket lines for all divisions in Markdown.
 
         Args:
             divisions: List of division data with playoff brackets
 
         Returns:
-            Formatted playoff bracket string in Markdown tables
+            Playoff bracket Markdown table lines
         """
         output_parts: list[str] = []
 
@@ -215,15 +241,14 @@ class MarkdownFormatter(BaseFormatter):
             bracket = division.playoff_bracket
             output_parts.append(f"## {division.name} - {bracket.round}")
             output_parts.append("")
-            output_parts.append("| Matchup | Team (Owner) | Seed | Score | Result |")
-            output_parts.append("|---------|--------------|------|-------|--------|")
+            output_parts.extend(_PLAYOFF_BRACKET_HEADER)
 
             for i, matchup in enumerate(bracket.matchups, 1):
                 matchup_name = f"Semifinal {i}" if bracket.round == "Semifinals" else "Finals"
 
                 # Team 1 row
                 team1_result = "✓ Winner" if matchup.winner_name == matchup.team1_name else ""
-                team1_score = f"{matchup.score1:.2f}" if matchup.score1 is not None else "TBD"
+                team1_score = matchup.score1_display
                 output_parts.append(
                     f"| **{matchup_name}** | {matchup.team1_name} ({matchup.owner1_name}) | "
                     f"#{matchup.seed1} | {team1_score} | {team1_result} |"
@@ -231,7 +256,7 @@ class MarkdownFormatter(BaseFormatter):
 
                 # Team 2 row
                 team2_result = "✓ Winner" if matchup.winner_name == matchup.team2_name else ""
-                team2_score = f"{matchup.score2:.2f}" if matchup.score2 is not None else "TBD"
+                team2_score = matchup.score2_display
                 output_parts.append(
                     f"|  | {matchup.team2_name} ({matchup.owner2_name}) | "
                     f"#{matchup.seed2} | {team2_score} | {team2_result} |"
@@ -239,46 +264,35 @@ class MarkdownFormatter(BaseFormatter):
 
             output_parts.append("")
 
-        return "\n".join(output_parts)
+        return output_parts
 
-    def _format_championship_leaderboard(
+    def _championship_leaderboard_lines(
         self, championship: ChampionshipLeaderboard, rosters: Sequence | None = None
-    ) -> str:
+    ) -> list[str]:
         """
-        Format championship week leaderboard in Markdown.
+        Build championship week leaderboard lines in Markdown.
 
         Args:
             championship: Championship leaderboard with ranked entries
             rosters: Detailed rosters to check game completion status
 
         Returns:
-            Formatted championship leaderboard string
+            Championship leaderboard lines
         """
         output_parts: list[str] = []
 
         output_parts.append("## CHAMPIONSHIP WEEK LEADERBOARD")
         output_parts.append("")
-        output_parts.append("| Rank | Team (Owner) | Division Champion | Final Score |")
-        output_parts.append("|------|--------------|-------------------|-------------|")
+        output_parts.extend(_CHAMPIONSHIP_HEADER)
 
         for entry in championship.entries:
-            # Add medal emoji for top 3
+            # Add medal emoji for top 3 and bold the leader
+            rank_display = _RANK_MEDALS.get(entry.rank) or str(entry.rank)
+            team_display = f"{entry.team_name} ({entry.owner_name})"
+            score_display = f"{entry.score:.2f}"
             if entry.rank == 1:
-                rank_display = "🥇"
-                team_display = f"**{entry.team_name} ({entry.owner_name})**"
-                score_display = f"**{entry.score:.2f}**"
-            elif entry.rank == 2:
-                rank_display = "🥈"
-                team_display = f"{entry.team_name} ({entry.owner_name})"
-                score_display = f"{entry.score:.2f}"
-            elif entry.rank == 3:
-                rank_display = "🥉"
-                team_display = f"{entry.team_name} ({entry.owner_name})"
-                score_display = f"{entry.score:.2f}"
-            else:
-                rank_display = str(entry.rank)
-                team_display = f"{entry.team_name} ({entry.owner_name})"
-                score_display = f"{entry.score:.2f}"
+                team_display = f"**{team_display}**"
+                score_display = f"**{score_display}**"
 
             output_parts.append(
                 f"| {rank_display} | {team_display} | {entry.division_name} | {score_display} |"
@@ -304,10 +318,10 @@ class MarkdownFormatter(BaseFormatter):
                 "_⏳ Games still in progress - final champion will be determined when all games complete_"
             )
 
-        return "\n".join(output_parts)
+        return output_parts
 
-    def _format_championship_rosters(self, rosters: Sequence) -> str:
-        """Format championship rosters as Markdown tables."""
+    def _championship_roster_lines(self, rosters: Sequence) -> list[str]:
+        """Build championship roster lines as Markdown tables."""
         output_parts: list[str] = []
 
         output_parts.append("## 📋 Detailed Rosters")
@@ -326,8 +340,7 @@ class MarkdownFormatter(BaseFormatter):
             # Starters table
             output_parts.append("#### 🏈 Starters")
             output_parts.append("")
-            output_parts.append("| Status | Pos | Player | Team | Points |")
-            output_parts.append("|--------|-----|--------|------|--------|")
+            output_parts.extend(_ROSTER_STARTERS_HEADER)
 
             for slot in roster.starters:
                 status_icon = "✅" if slot.game_status == "final" else "⏳"
@@ -340,24 +353,22 @@ class MarkdownFormatter(BaseFormatter):
 
             output_parts.append("")
 
-        return "\n".join(output_parts)
+        return output_parts
 
-    def _format_weekly_player_table(self, player_challenges: Sequence[WeeklyChallenge]) -> str:
+    def _weekly_player_table_lines(self, player_challenges: Sequence[WeeklyChallenge]) -> list[str]:
         """
-        Format player highlights table for playoffs in Markdown.
+        Build player highlights table lines for playoffs in Markdown.
 
         Args:
             player_challenges: Player-only challenges
 
         Returns:
-            Formatted player highlights table
+            Player highlights table lines
         """
-        lines: list[str] = []
-        lines.append("| Challenge | Player (Position) | Team | Points |")
-        lines.append("|-----------|-------------------|------|--------|")
+        lines = list(_WEEKLY_PLAYOFF_PLAYER_HEADER)
 
         for challenge in player_challenges:
-            position = challenge.additional_info.get("position", "")
+            position = challenge.position
             winner_display = f"{challenge.winner} ({position})"
             team_name = challenge.additional_info.get("team_name", challenge.division)
 
@@ -365,115 +376,97 @@ class MarkdownFormatter(BaseFormatter):
                 f"| {challenge.challenge_name} | {winner_display} | {team_name} | {challenge.value} |"
             )
 
-        return "\n".join(lines)
+        return lines
 
-    def _format_division_table(self, division: DivisionData) -> str:
-        """Format a single division's standings table in Markdown."""
+    def _division_table_lines(self, division: DivisionData) -> list[str]:
+        """Build the lines of a single division's standings table in Markdown."""
         sorted_teams = self._get_sorted_teams_by_division(division)
 
         # Table header
-        lines = [
-            "| Rank | Team | Owner | Points For | Points Against | Record |",
-            "|------|------|-------|------------|----------------|--------|",
-        ]
+        lines = list(_DIVISION_HEADER)
 
         # Table rows
+        append = lines.append
         for i, team in enumerate(sorted_teams, 1):
             # Add asterisk to team name if in playoffs
-            team_name = team.name
-            if team.in_playoff_position:
-                team_name = f"\\* {team.name}"
-
-            lines.append(
-                f"| {i} | {team_name} | {team.owner.full_name} | "
-                f"{team.points_for:.2f} | {team.points_against:.2f} | "
-                f"{team.wins}-{team.losses} |"
+            prefix = _PLAYOFF_PREFIX if team.in_playoff_position else ""
+            append(
+                f"| {i} | {prefix}{team.name} | {team.owner.full_name} | {team.points_for:.2f} | "
+                f"{team.points_against:.2f} | {team.record} |"
             )
 
-        return "\n".join(lines)
+        return lines
 
-    def _format_overall_table(self, divisions: Sequence[DivisionData]) -> str:
-        """Format overall top teams table in Markdown."""
+    def _overall_table_lines(self, divisions: Sequence[DivisionData]) -> list[str]:
+        """Build the lines of the overall top teams table in Markdown."""
         top_teams = self._get_overall_top_teams(divisions, limit=20)
 
         # Table header
-        lines = [
-            "| Rank | Team | Owner | Division | Points For | Points Against | Record |",
-            "|------|------|-------|----------|------------|----------------|--------|",
-        ]
+        lines = list(_OVERALL_HEADER)
 
-        # Table rows
+        # Table rows (one f-string per row measures faster than joining a tuple of cells
+        # or calling a module-level str.format template)
+        append = lines.append
         for i, team in enumerate(top_teams, 1):
             # Add asterisk to team name if in playoffs
-            team_name = team.name
-            if team.in_playoff_position:
-                team_name = f"\\* {team.name}"
-
-            lines.append(
-                f"| {i} | {team_name} | {team.owner.full_name} | {team.division} | "
-                f"{team.points_for:.2f} | {team.points_against:.2f} | "
-                f"{team.wins}-{team.losses} |"
+            prefix = _PLAYOFF_PREFIX if team.in_playoff_position else ""
+            append(
+                f"| {i} | {prefix}{team.name} | {team.owner.full_name} | {team.division} | "
+                f"{team.points_for:.2f} | {team.points_against:.2f} | {team.record} |"
             )
 
-        return "\n".join(lines)
+        return lines
 
-    def _format_challenge_table(self, challenges: Sequence[ChallengeResult]) -> str:
-        """Format challenge results table in Markdown."""
+    def _challenge_table_lines(self, challenges: Sequence[ChallengeResult]) -> list[str]:
+        """Build the lines of the challenge results table in Markdown."""
         # Table header
-        lines = [
-            "| Challenge | Winner | Owner | Division | Details |",
-            "|-----------|--------|-------|----------|---------|",
-        ]
+        lines = list(_CHALLENGE_HEADER)
 
         # Table rows
-        for challenge in challenges:
-            lines.append(
-                f"| {challenge.challenge_name} | {challenge.winner} | "
-                f"{challenge.owner.full_name} | {challenge.division} | "
-                f"{challenge.description} |"
-            )
-
-        return "\n".join(lines)
+        lines.extend(
+            f"| {challenge.challenge_name} | {challenge.winner} | {challenge.owner.full_name} | "
+            f"{challenge.division} | {challenge.description} |"
+            for challenge in challenges
+        )
 
-    def _format_weekly_table(self, weekly_challenges: Sequence[WeeklyChallenge]) -> str:
-        """Format weekly challenge results table in Markdown."""
-        # Split into team and player challenges
-        team_challenges = [c for c in weekly_challenges if "position" not in c.additional_info]
-        player_challenges = [c for c in weekly_challenges if "position" in c.additional_info]
+        return lines
 
+    def _weekly_table_lines(
+        self,
+        team_challenges: Sequence[WeeklyChallenge],
+        player_challenges: Sequence[WeeklyChallenge],
+    ) -> list[str]:
+        """Build the lines of the weekly team and player challenge tables in Markdown."""
         lines: list[str] = []
+        append = lines.append
 
         # Team challenges table
         if team_challenges:
-            lines.append("**Team Challenges:**")
-            lines.append("")
-            lines.append("| Challenge | Team | Division | Value |")
-            lines.append("|-----------|------|----------|-------|")
+            append("**Team Challenges:**")
+            append("")
+            lines.extend(_WEEKLY_TEAM_HEADER)
 
             for challenge in team_challenges:
-                lines.append(
+                append(
                     f"| {challenge.challenge_name} | {challenge.winner} | "
                     f"{challenge.division} | {challenge.value} |"
                 )
 
-            lines.append("")
+            append("")
 
         # Player highlights table
         if player_challenges:
-            lines.append("**Player Highlights:**")
-            lines.append("")
-            lines.append("| Challenge | Player | Points |")
-            lines.append("|-----------|--------|--------|")
+            append("**Player Highlights:**")
+            append("")
+            lines.extend(_WEEKLY_PLAYER_HEADER)
 
             for challenge in player_challenges:
                 # Include position in player display
-                position = challenge.additional_info.get("position", "")
+                position = challenge.position
                 winner_display = f"{challenge.winner} ({position})"
 
-                lines.append(
-                    f"| {challenge.challenge_name} | {winner_display} | {challenge.value} |"
-                )
+                append(f"| {challenge.challenge_name} | {winner_display} | {challenge.value} |")
 
-            lines.append("")
+            append("")
 
-        return "\n".join(lines)
+        return lines
@@ -7,9 +7,97 @@ including regular season, playoffs, and championship results.
 
 from __future__ import annotations
 
-from tabulate import tabulate
+from collections.abc import Sequence
+
+from wcwidth import wcswidth
 
 from ..models.season_summary import SeasonSummary
+from ..models.team import TeamStats
+
+# Section rules and the champion celebration banner
+_RULE = "=" * 80
+_THIN_RULE = "-" * 80
+_PARTY = "🎉" * 40
+
+# Extra columns reserved beside each header label, matching tabulate's layout
+_HEADER_MIN_PADDING = 2
+
+
+def _display_width(text: str) -> int:
+    """Return the terminal column width of text, counting wide emoji as two columns."""
+    width = wcswidth(text)
+    return width if width >= 0 else len(text)
+
+
+def _is_number(text: str) -> bool:
+    """Return True if text parses as a number, the test tabulate uses to right-align a column."""
+    try:
+        float(text)
+    except ValueError:
+        return False
+    return True
+
+
+def _standings_sort_key(team: TeamStats) -> tuple[int, int, float]:
+    """Sort key ranking teams by wins, then fewest losses, then points for."""
+    return (team.wins, -team.losses, team.points_for)
+
+
+def _render_table(
+    headers: Sequence[str],
+    rows: Sequence[Sequence[str]],
+    grid: bool = True,
+) -> str:
+    """
+    Render pre-formatted string cells as a plain-text table.
+
+    Cell widths are measured once and reused for both the column widths and
+    the padding. As with tabulate, a column is right-aligned when every cell
+    in it is a number and left-aligned otherwise, and headers keep the same
+    minimum padding tabulate applied.
+
+    Args:
+        headers: Column header labels
+        rows: Table rows with one pre-formatted string per column
+        grid: Draw a bordered grid when True, a simple underlined table otherwise
+
+    Returns:
+        Rendered table string
+    """
+    all_rows = [headers, *rows]
+    cell_widths = [[_display_width(cell) for cell in row] for row in all_rows]
+    col_widths = [
+        max([header_width + _HEADER_MIN_PADDING, *column])
+        for header_width, *column in zip(*cell_widths)
+    ]
+    numeric_columns = {
+        idx for idx in range(len(headers)) if rows and all(_is_number(row[idx]) for row in rows)
+    }
+
+    def render_cells(row: Sequence[str], widths: list[int]) -> list[str]:
+        cells = []
+        for idx, cell in enumerate(row):
+            fill = " " * (col_widths[idx] - widths[idx])
+            cells.append(fill + cell if idx in numeric_columns else cell + fill)
+        return cells
+
+    rendered = [render_cells(row, widths) for row, widths in zip(all_rows, cell_widths)]
+
+    if not grid:
+        # Simple rows drop trailing padding, as tabulate does
+        lines = ["  ".join(rendered[0]).rstrip(), "  ".join("-" * width for width in col_widths)]
+        lines.extend("  ".join(cells).rstrip() for cells in rendered[1:])
+        return "\n".join(lines)
+
+    border = "+" + "+".join("-" * (width + 2) for width in col_widths) + "+"
+    lines = [border, "| " + " | ".join(rendered[0]) + " |", border.replace("-", "=")]
+    for cells in rendered[1:]:
+        lines.append("| " + " | ".join(cells) + " |")
+        lines.append(border)
+    if not rows:
+        # A header-only grid still closes with a border line
+        lines.append(border)
+    return "\n".join(lines)
 
 
 class SeasonRecapConsoleFormatter:
@@ -26,6 +114,8 @@ class SeasonRecapConsoleFormatter:
         self.year = year
         self.format_args = format_args or {}
 
+        self._note = self._get_arg("note")
+
     @classmethod
     def get_supported_args(cls) -> dict[str, str]:
         """Return supported format arguments for console formatter."""
@@ -56,104 +146,98 @@ class SeasonRecapConsoleFormatter:
         Returns:
             Formatted console output string
         """
-        # Get format arguments
-        note = self._get_arg("note")
+        note = self._note
 
         output_lines: list[str] = []
+        structure = summary.structure
 
         # Header
-        output_lines.append("\n" + "=" * 80)
-        output_lines.append(" " * 25 + f"🏆 {self.year} SEASON RECAP 🏆")
-        output_lines.append("=" * 80)
-        output_lines.append(f"📊 {summary.total_divisions} divisions")
-        output_lines.append(
-            f"📅 Regular Season: Weeks {summary.structure.regular_season_start}-{summary.structure.regular_season_end}"
+        output_lines.extend(
+            (
+                "\n" + _RULE,
+                " " * 25 + f"🏆 {self.year} SEASON RECAP 🏆",
+                _RULE,
+                f"📊 {summary.total_divisions} divisions",
+                f"📅 Regular Season: Weeks {structure.regular_season_start}-{structure.regular_season_end}",
+            )
         )
         if summary.playoffs:
             output_lines.append(
-                f"🏈 Playoffs: Weeks {summary.structure.playoff_start}-{summary.structure.playoff_end}"
+                f"🏈 Playoffs: Weeks {structure.playoff_start}-{structure.playoff_end}"
             )
         if summary.championship:
-            output_lines.append(f"🏆 Championship: Week {summary.structure.championship_week}")
+            output_lines.append(f"🏆 Championship: Week {structure.championship_week}")
 
         # Optional note
         if note:
             note_content = f"⚠️  {note}"
-            note_table = tabulate([[note_content]], tablefmt="fancy_grid")
-            output_lines.append("")
-            output_lines.append(note_table)
+            bar = "═" * (_display_width(note_content) + 2)
+            output_lines.extend(("", f"╒{bar}╕\n│ {note_content} │\n╘{bar}╛"))
 
         # Championship Results (if complete)
         if summary.championship:
-            output_lines.append("")
-            output_lines.append("=" * 80)
-            output_lines.append(
-                " " * 22 + f"🏆 CHAMPIONSHIP WEEK {summary.structure.championship_week} 🏆"
+            output_lines.extend(
+                (
+                    "",
+                    _RULE,
+                    " " * 22 + f"🏆 CHAMPIONSHIP WEEK {structure.championship_week} 🏆",
+                    " " * 18 + "DIVISION WINNERS COMPETE FOR OVERALL TITLE",
+                    _RULE,
+                    self._format_championship_leaderboard(summary.championship),
+                )
             )
-            output_lines.append(" " * 18 + "DIVISION WINNERS COMPETE FOR OVERALL TITLE")
-            output_lines.append("=" * 80)
-            championship_table = self._format_championship_leaderboard(summary.championship)
-            output_lines.append(championship_table)
 
             # Champion announcement
-            if summary.overall_champion:
-                output_lines.append("")
-                output_lines.append("🎉" * 40)
-                output_lines.append(
-                    f"🏆 SEASON CHAMPION: {summary.overall_champion.team_name} "
-                    f"({summary.overall_champion.owner_name}) 🏆"
+            champion = summary.overall_champion
+            if champion:
+                output_lines.extend(
+                    (
+                        "",
+                        _PARTY,
+                        f"🏆 SEASON CHAMPION: {champion.team_name} ({champion.owner_name}) 🏆",
+                        f"   Final Score: {champion.score:.2f} points",
+                        _PARTY,
+                    )
                 )
-                output_lines.append(f"   Final Score: {summary.overall_champion.score:.2f} points")
-                output_lines.append("🎉" * 40)
 
         # Playoff Results (reverse chronological: Finals → Semifinals)
         if summary.playoffs:
-            output_lines.append("")
-            output_lines.append("=" * 80)
-            output_lines.append(" " * 30 + "🏈 PLAYOFF RESULTS 🏈")
-            output_lines.append("=" * 80)
+            output_lines.extend(("", _RULE, " " * 30 + "🏈 PLAYOFF RESULTS 🏈", _RULE))
 
             # Finals (show first - most recent)
             if summary.playoffs.finals:
-                finals_output = self._format_playoff_round(summary.playoffs.finals)
-                output_lines.append(finals_output)
+                output_lines.extend(self._playoff_round_lines(summary.playoffs.finals))
 
             # Semifinals (show second - earlier round)
             if summary.playoffs.semifinals:
-                semifinals_output = self._format_playoff_round(summary.playoffs.semifinals)
-                output_lines.append(semifinals_output)
-
-        # Regular Season Results
-        output_lines.append("")
-        output_lines.append("=" * 80)
-        output_lines.append(" " * 22 + "📊 REGULAR SEASON FINAL RESULTS 📊")
-        output_lines.append("=" * 80)
-
-        # Regular Season Division Champions
-        output_lines.append("")
-        output_lines.append("🏆 REGULAR SEASON DIVISION CHAMPIONS")
-        champions_table = self._format_division_champions(summary.regular_season.division_champions)
-        output_lines.append(champions_table)
-
-        # Season Challenges
-        output_lines.append("")
-        output_lines.append("💰 SEASON-LONG CHALLENGE WINNERS")
-        challenges_table = self._format_season_challenges(summary.season_challenges)
-        output_lines.append(challenges_table)
+                output_lines.extend(self._playoff_round_lines(summary.playoffs.semifinals))
+
+        # Regular Season Results, Division Champions and Season Challenges
+        output_lines.extend(
+            (
+                "",
+                _RULE,
+                " " * 22 + "📊 REGULAR SEASON FINAL RESULTS 📊",
+                _RULE,
+                "",
+                "🏆 REGULAR SEASON DIVISION CHAMPIONS",
+                self._format_division_champions(summary.regular_season.division_champions),
+                "",
+                "💰 SEASON-LONG CHALLENGE WINNERS",
+                self._format_season_challenges(summary.season_challenges),
+                "",
+                "📋 FINAL STANDINGS BY DIVISION",
+            )
+        )
 
         # Final Standings by Division
-        output_lines.append("")
-        output_lines.append("📋 FINAL STANDINGS BY DIVISION")
         for division_data in summary.regular_season.final_standings:
-            output_lines.append(f"\n{division_data.name}:")
-            standings_table = self._format_division_standings(division_data)
-            output_lines.append(standings_table)
+            output_lines.extend(
+                (f"\n{division_data.name}:", self._format_division_standings(division_data))
+            )
 
         # Footer
-        output_lines.append("")
-        output_lines.append("=" * 80)
-        output_lines.append(f"Report generated: {summary.generated_at}")
-        output_lines.append("=" * 80)
+        output_lines.extend(("", _RULE, f"Report generated: {summary.generated_at}", _RULE))
 
         return "\n".join(output_lines)
 
@@ -168,13 +252,14 @@ class SeasonRecapConsoleFormatter:
             Formatted table string
         """
         headers = ["Rank", "Team", "Owner", "Division", "Score"]
-        rows = []
+        rows: list[list[str]] = []
+        append = rows.append
 
         for entry in championship.entries:
             # Add trophy emoji for champion
             rank_display = f"🏆 {entry.rank}" if entry.is_champion else str(entry.rank)
 
-            rows.append(
+            append(
                 [
                     rank_display,
                     entry.team_name,
@@ -184,71 +269,66 @@ class SeasonRecapConsoleFormatter:
                 ]
             )
 
-        return tabulate(rows, headers=headers, tablefmt="grid")
+        return _render_table(headers, rows)
 
-    def _format_playoff_round(self, playoff_round) -> str:
+    def _playoff_round_lines(self, playoff_round) -> list[str]:
         """
-        Format a single playoff round across all divisions.
+        Build the lines for a single playoff round across all divisions.
 
         Args:
             playoff_round: PlayoffRound with matchups
 
         Returns:
-            Formatted playoff round string
+            Playoff round lines, joined once by the caller
         """
-        output_parts: list[str] = []
-
-        output_parts.append("")
-        output_parts.append(f"🏈 {playoff_round.round_name.upper()} - Week {playoff_round.week}")
-        output_parts.append("-" * 80)
+        lines = [
+            "",
+            f"🏈 {playoff_round.round_name.upper()} - Week {playoff_round.week}",
+            _THIN_RULE,
+        ]
 
         for bracket in playoff_round.division_brackets:
-            output_parts.append("")
-            output_parts.append(f"📍 {bracket.division_name}")
+            lines.extend(("", f"📍 {bracket.division_name}"))
 
-            # Build matchup table
             for idx, matchup in enumerate(bracket.matchups):
-                matchup_output = self._format_playoff_matchup(matchup)
-                output_parts.append(matchup_output)
-                # Add blank line between matchups (but not after the last one)
-                if idx < len(bracket.matchups) - 1:
-                    output_parts.append("")
+                # Add blank line between matchups (but not before the first one)
+                if idx:
+                    lines.append("")
+                lines.extend(self._playoff_matchup_lines(matchup))
 
-        return "\n".join(output_parts)
+        return lines
 
-    def _format_playoff_matchup(self, matchup) -> str:
+    def _playoff_matchup_lines(self, matchup) -> list[str]:
         """
-        Format a single playoff matchup.
+        Build the lines for a single playoff matchup.
 
         Args:
             matchup: PlayoffMatchup data
 
         Returns:
-            Formatted matchup string
+            Two team lines, plus a winner line once the game is complete
         """
         # Determine if game is complete
-        game_complete = matchup.winner_name is not None
+        winner = matchup.winner_name
+        game_complete = winner is not None
+        team1, team2 = matchup.team1_name, matchup.team2_name
 
-        # Format team lines with winner indication
-        team1_indicator = (
-            "✅" if game_complete and matchup.winner_name == matchup.team1_name else "  "
-        )
-        team2_indicator = (
-            "✅" if game_complete and matchup.winner_name == matchup.team2_name else "  "
-        )
+        # Format team lines with winner indication (winner is None until final)
+        team1_indicator = "✅" if winner == team1 else "  "
+        team2_indicator = "✅" if winner == team2 else "  "
 
-        score1 = f"{matchup.score1:.2f}" if matchup.score1 is not None else "TBD"
-        score2 = f"{matchup.score2:.2f}" if matchup.score2 is not None else "TBD"
+        score1 = matchup.score1_display
+        score2 = matchup.score2_display
 
         lines = [
-            f"  {team1_indicator} (#{matchup.seed1}) {matchup.team1_name} - {score1}",
-            f"  {team2_indicator} (#{matchup.seed2}) {matchup.team2_name} - {score2}",
+            f"  {team1_indicator} (#{matchup.seed1}) {team1} - {score1}",
+            f"  {team2_indicator} (#{matchup.seed2}) {team2} - {score2}",
         ]
 
         if game_complete:
-            lines.append(f"     Winner: {matchup.winner_name}")
+            lines.append(f"     Winner: {winner}")
 
-        return "\n".join(lines)
+        return lines
 
     def _format_division_champions(self, champions) -> str:
         """
@@ -261,10 +341,11 @@ class SeasonRecapConsoleFormatter:
             Formatted table string
         """
         headers = ["Division", "Team", "Owner", "Record", "Points For"]
-        rows = []
+        rows: list[list[str]] = []
+        append = rows.append
 
         for champion in champions:
-            rows.append(
+            append(
                 [
                     champion.division_name,
                     champion.team_name,
@@ -274,7 +355,7 @@ class SeasonRecapConsoleFormatter:
                 ]
             )
 
-        return tabulate(rows, headers=headers, tablefmt="grid")
+        return _render_table(headers, rows)
 
     def _format_season_challenges(self, challenges) -> str:
         """
@@ -287,10 +368,11 @@ class SeasonRecapConsoleFormatter:
             Formatted table string
         """
         headers = ["Challenge", "Winner", "Owner", "Division", "Value"]
-        rows = []
+        rows: list[list[str]] = []
+        append = rows.append
 
         for challenge in challenges:
-            rows.append(
+            append(
                 [
                     challenge.challenge_name,
                     challenge.winner,
@@ -300,7 +382,7 @@ class SeasonRecapConsoleFormatter:
                 ]
             )
 
-        return tabulate(rows, headers=headers, tablefmt="grid")
+        return _render_table(headers, rows)
 
     def _format_division_standings(self, division_data) -> str:
         """
@@ -313,25 +395,22 @@ class SeasonRecapConsoleFormatter:
             Formatted table string
         """
         headers = ["Rank", "Team", "Owner", "Record", "PF", "PA"]
-        rows = []
+        rows: list[list[str]] = []
+        append = rows.append
 
         # Sort teams by record
-        sorted_teams = sorted(
-            division_data.teams,
-            key=lambda t: (t.wins, -t.losses, t.points_for),
-            reverse=True,
-        )
+        sorted_teams = sorted(division_data.teams, key=_standings_sort_key, reverse=True)
 
         for rank, team in enumerate(sorted_teams, 1):
-            rows.append(
+            append(
                 [
-                    rank,
+                    str(rank),
                     team.name,
                     team.owner.full_name,
-                    f"{team.wins}-{team.losses}",
+                    team.record,
                     f"{team.points_for:.2f}",
                     f"{team.points_against:.2f}",
                 ]
             )
 
-        return tabulate(rows, headers=headers, tablefmt="simple")
+        return _render_table(headers, rows, grid=False)
@@ -6,136 +6,85 @@ Provides mobile-friendly HTML email format suitable for end-of-season summaries.
 
 from __future__ import annotations
 
-from importlib.metadata import version
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+from string import Template
+from typing import TextIO
 
-from ..models.season_summary import SeasonSummary
+from ..models.season_summary import PlayoffRound, SeasonSummary
+from .base import _package_version
 
-
-class SeasonRecapEmailFormatter:
-    """Formatter for season recap HTML email output."""
-
-    def __init__(self, year: int, format_args: dict[str, str] | None = None) -> None:
-        """
-        Initialize season recap email formatter.
-
-        Args:
-            year: Fantasy season year for display
-            format_args: Optional dict of formatter-specific arguments
-        """
-        self.year = year
-        self.format_args = format_args or {}
-
-    @classmethod
-    def get_supported_args(cls) -> dict[str, str]:
-        """Return supported format arguments for email formatter."""
-        return {
-            "note": "Optional alert message displayed at top of email",
-            "accent_color": "Hex color for highlight sections (default: #ffc107)",
-        }
-
-    def _get_arg(self, key: str, default: str | None = None) -> str | None:
-        """
-        Safely retrieve a format argument with optional default.
-
-        Args:
-            key: Argument name to retrieve
-            default: Default value if argument not provided
-
-        Returns:
-            Argument value or default
-        """
-        return self.format_args.get(key, default)
-
-    def format(self, summary: SeasonSummary) -> str:
-        """
-        Format complete season summary as mobile-friendly HTML email.
-
-        Args:
-            summary: Complete season summary data
-
-        Returns:
-            HTML string suitable for email delivery
-        """
-        # Get format arguments
-        note = self._get_arg("note")
-        accent_color = self._get_arg("accent_color", "#ffc107")
-
-        # Get package version
-        try:
-            pkg_version = version("ff_tracker")
-        except Exception:
-            pkg_version = "unknown"
-
-        html_content = f"""
+# Static document head and stylesheet, parsed once at import
+_HEAD_TEMPLATE = Template("""
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Season Recap {self.year}</title>
+    <title>Season Recap $year</title>
     <style>
-        body {{
+        body {
             font-family: Arial, sans-serif;
             font-size: 14px;
             line-height: 1.4;
             margin: 0;
             padding: 10px;
             background-color: #f5f5f5;
-        }}
-        .container {{
+        }
+        .container {
             max-width: 100%;
             background-color: white;
             padding: 15px;
             border-radius: 8px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        h1 {{
+        }
+        h1 {
             color: #2c3e50;
             font-size: 20px;
             margin: 0 0 10px 0;
             text-align: center;
-        }}
-        h2 {{
+        }
+        h2 {
             color: #34495e;
             font-size: 16px;
             margin: 20px 0 10px 0;
             border-bottom: 2px solid #3498db;
             padding-bottom: 5px;
-        }}
-        h3 {{
+        }
+        h3 {
             color: #2c3e50;
             font-size: 14px;
             margin: 15px 0 10px 0;
-        }}
-        .summary {{
+        }
+        .summary {
             text-align: center;
             color: #7f8c8d;
             margin-bottom: 20px;
             font-size: 12px;
-        }}
-        table {{
+        }
+        table {
             width: 100%;
             border-collapse: collapse;
             margin-bottom: 20px;
             font-size: 12px;
-        }}
-        th, td {{
+        }
+        th, td {
             padding: 6px 4px;
             text-align: left;
             border-bottom: 1px solid #ddd;
-        }}
-        th {{
+        }
+        th {
             background-color: #ecf0f1;
             font-weight: bold;
             color: #2c3e50;
-        }}
-        tr:nth-child(even) {{
+        }
+        tr:nth-child(even) {
             background-color: #f9f9f9;
-        }}
-        .number {{
+        }
+        .number {
             text-align: right;
-        }}
-        .alert-box {{
+        }
+        .alert-box {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             border: 2px solid #5a67d8;
             padding: 15px;
@@ -146,8 +95,8 @@ class SeasonRecapEmailFormatter:
             text-align: center;
             box-shadow: 0 4px 6px rgba(0,0,0,0.15);
             font-size: 14px;
-        }}
-        .championship-box {{
+        }
+        .championship-box {
             background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
             border: 3px solid #d63384;
             padding: 20px;
@@ -156,29 +105,29 @@ class SeasonRecapEmailFormatter:
             color: white;
             text-align: center;
             box-shadow: 0 6px 12px rgba(0,0,0,0.2);
-        }}
-        .championship-box h2 {{
+        }
+        .championship-box h2 {
             color: white;
             border-bottom: 2px solid white;
             margin-top: 0;
-        }}
-        .championship-box table {{
+        }
+        .championship-box table {
             background-color: white;
             border-radius: 5px;
             overflow: hidden;
-        }}
-        .championship-box th {{
+        }
+        .championship-box th {
             background-color: #2c3e50;
             color: white;
-        }}
-        .championship-box td {{
+        }
+        .championship-box td {
             color: #2c3e50;
             background-color: white;
-        }}
-        .championship-box tr:nth-child(even) td {{
+        }
+        .championship-box tr:nth-child(even) td {
             background-color: #f8f9fa;
-        }}
-        .champion-announcement {{
+        }
+        .champion-announcement {
             background-color: rgba(255,255,255,0.95);
             color: #2c3e50;
             padding: 15px;
@@ -186,94 +135,215 @@ class SeasonRecapEmailFormatter:
             margin-top: 15px;
             font-size: 16px;
             border: 2px solid white;
-        }}
-        .champion-announcement strong {{
+        }
+        .champion-announcement strong {
             color: #d63384;
-        }}
-        .playoff-bracket {{
+        }
+        .playoff-bracket {
             background-color: #e8f4f8;
             padding: 15px;
             border-radius: 5px;
             margin-bottom: 20px;
             border-left: 4px solid #3498db;
-        }}
-        .playoff-bracket h2 {{
+        }
+        .playoff-bracket h2 {
             color: #2c3e50;
             margin-top: 0;
-        }}
-        .playoff-division {{
+        }
+        .playoff-division {
             margin-bottom: 20px;
-        }}
-        .playoff-division h4 {{
+        }
+        .playoff-division h4 {
             margin: 0 0 10px 0;
             color: #34495e;
             font-size: 14px;
             font-weight: bold;
-        }}
-        .playoff-matchup {{
+        }
+        .playoff-matchup {
             background-color: white;
             padding: 10px;
             margin-bottom: 10px;
             border-radius: 5px;
             border: 1px solid #bdc3c7;
-        }}
-        .playoff-team {{
+        }
+        .playoff-team {
             padding: 8px;
             margin-bottom: 5px;
             background-color: #f8f9fa;
             border-radius: 3px;
-        }}
-        .playoff-winner {{
+        }
+        .playoff-winner {
             background-color: #d4edda;
             border-left: 4px solid #28a745;
             font-weight: bold;
-        }}
-        .season-highlight {{
+        }
+        .season-highlight {
             background-color: #fff3cd;
             padding: 15px;
             border-radius: 5px;
             margin-bottom: 20px;
-            border-left: 4px solid {accent_color};
-        }}
-        .season-highlight h2 {{
+            border-left: 4px solid $accent_color;
+        }
+        .season-highlight h2 {
             color: #856404;
             margin-top: 0;
-        }}
-        .footer {{
+        }
+        .footer {
             text-align: center;
             color: #95a5a6;
             font-size: 10px;
             margin-top: 20px;
             padding-top: 10px;
             border-top: 1px solid #ecf0f1;
-        }}
-        @media (max-width: 480px) {{
-            body {{
+        }
+        @media (max-width: 480px) {
+            body {
                 font-size: 12px;
                 padding: 5px;
-            }}
-            .container {{
+            }
+            .container {
                 padding: 10px;
-            }}
-            h1 {{
+            }
+            h1 {
                 font-size: 18px;
-            }}
-            h2 {{
+            }
+            h2 {
                 font-size: 14px;
-            }}
-            h3 {{
+            }
+            h3 {
                 font-size: 12px;
-            }}
-            table {{
+            }
+            table {
                 font-size: 10px;
-            }}
-            th, td {{
+            }
+            th, td {
                 padding: 4px 2px;
-            }}
-        }}
+            }
+        }
     </style>
 </head>
-<body>
+""")
+
+
+@lru_cache(maxsize=8)
+def _render_head(year: int, accent_color: str) -> str:
+    """Return the substituted document head, shared across formatter instances."""
+    return _HEAD_TEMPLATE.substitute(year=year, accent_color=accent_color)
+
+
+class SeasonRecapEmailFormatter:
+    """Formatter for season recap HTML email output."""
+
+    def __init__(self, year: int, format_args: dict[str, str] | None = None) -> None:
+        """
+        Initialize season recap email formatter.
+
+        Args:
+            year: Fantasy season year for display
+            format_args: Optional dict of formatter-specific arguments
+        """
+        self.year = year
+        self.format_args = format_args or {}
+
+        self._note = self._get_arg("note")
+        self._accent_color = self._get_arg("accent_color", "#ffc107")
+
+        # Team, owner and division names repeat across sections; escape each once
+        self._escape_cache: dict[str, str] = {}
+
+    @classmethod
+    def get_supported_args(cls) -> dict[str, str]:
+        """Return supported format arguments for email formatter."""
+        return {
+            "note": "Optional alert message displayed at top of email",
+            "accent_color": "Hex color for highlight sections (default: #ffc107)",
+        }
+
+    def _get_arg(self, key: str, default: str | None = None) -> str | None:
+        """
+        Safely retrieve a format argument with optional default.
+
+        Args:
+            key: Argument name to retrieve
+            default: Default value if argument not provided
+
+        Returns:
+            Argument value or default
+        """
+        return self.format_args.get(key, default)
+
+    def _escape_html(self, text: str) -> str:
+        """Escape HTML special characters, reusing the result for repeated names."""
+        escaped = self._escape_cache.get(text)
+        if escaped is None:
+            escaped = (
+                text.replace("&", "&amp;")
+                .replace("<", "&lt;")
+                .replace(">", "&gt;")
+                .replace('"', "&quot;")
+                .replace("'", "&#x27;")
+            )
+            self._escape_cache[text] = escaped
+        return escaped
+
+    def format(self, summary: SeasonSummary) -> str:
+        """
+        Format complete season summary as mobile-friendly HTML email.
+
+        Args:
+            summary: Complete season summary data
+
+        Returns:
+            HTML string suitable for email delivery
+        """
+        return "".join(self._iter_html(summary))
+
+    def format_to(self, summary: SeasonSummary, out: TextIO) -> None:
+        """
+        Write the season summary HTML email to a file-like object.
+
+        Chunks are written as they are rendered, so the full document is
+        never held in memory as a single string.
+
+        Args:
+            summary: Complete season summary data
+            out: Text stream to write the HTML to
+        """
+        out.writelines(self._iter_html(summary))
+
+    def format_many(self, summaries: Iterable[SeasonSummary]) -> Iterator[str]:
+        """
+        Format several season summaries, one HTML email per summary.
+
+        The document head, package version and escaped names are shared
+        across all documents rendered by this formatter.
+
+        Args:
+            summaries: Season summaries to format
+
+        Yields:
+            HTML string for each summary, in input order
+        """
+        iter_html = self._iter_html
+        for summary in summaries:
+            yield "".join(iter_html(summary))
+
+    def _iter_html(self, summary: SeasonSummary) -> Iterator[str]:
+        """
+        Render the season summary HTML email as a sequence of chunks.
+
+        Args:
+            summary: Complete season summary data
+
+        Yields:
+            Consecutive pieces of the HTML document
+        """
+        note = self._note
+        pkg_version = _package_version()
+        esc = self._escape_html
+
+        yield _render_head(self.year, self._accent_color)
+        yield f"""<body>
     <div class="container">
         <h1>🏆 {self.year} Season Recap</h1>
         <div class="summary">
@@ -282,24 +352,24 @@ class SeasonRecapEmailFormatter:
 """
 
         if summary.playoffs:
-            html_content += f" • Playoffs: Weeks {summary.structure.playoff_start}-{summary.structure.playoff_end}"
+            yield f" • Playoffs: Weeks {summary.structure.playoff_start}-{summary.structure.playoff_end}"
 
         if summary.championship:
-            html_content += f" • Championship: Week {summary.structure.championship_week}"
+            yield f" • Championship: Week {summary.structure.championship_week}"
 
-        html_content += "\n        </div>\n"
+        yield "\n        </div>\n"
 
         # Optional note
         if note:
-            html_content += f"""
+            yield f"""
         <div class="alert-box">
-            ⚠️ {note}
+            ⚠️ {esc(note)}
         </div>
 """
 
         # Championship results (if available)
         if summary.championship:
-            html_content += """
+            yield """
         <div class="championship-box">
             <h2>🏆 Championship Week</h2>
             <p>Division Winners Compete for Overall Title</p>
@@ -316,31 +386,31 @@ class SeasonRecapEmailFormatter:
                 <tbody>
 """
             for entry in summary.championship.entries:
-                champion_marker = "🏆 " if entry.rank == 1 else ""
-                html_content += f"""
+                champion_marker = "🏆 " if entry.is_champion else ""
+                yield f"""
                     <tr>
                         <td>{entry.rank}</td>
-                        <td>{champion_marker}{entry.team_name}</td>
-                        <td>{entry.owner_name}</td>
-                        <td>{entry.division_name}</td>
+                        <td>{champion_marker}{esc(entry.team_name)}</td>
+                        <td>{esc(entry.owner_name)}</td>
+                        <td>{esc(entry.division_name)}</td>
                         <td class="number">{entry.score:.2f}</td>
                     </tr>
 """
 
-            html_content += """
+            yield """
                 </tbody>
             </table>
 """
 
             if summary.overall_champion:
-                html_content += f"""
+                yield f"""
             <div class="champion-announcement">
-                <p><strong>🎉 Season Champion: {summary.overall_champion.team_name}</strong></p>
-                <p>{summary.overall_champion.owner_name} from {summary.overall_champion.division_name} won with {summary.overall_champion.score:.2f} points!</p>
+                <p><strong>🎉 Season Champion: {esc(summary.overall_champion.team_name)}</strong></p>
+                <p>{esc(summary.overall_champion.owner_name)} from {esc(summary.overall_champion.division_name)} won with {summary.overall_champion.score:.2f} points!</p>
             </div>
 """
 
-            html_content += """
+            yield """
         </div>
 """
 
@@ -348,86 +418,14 @@ class SeasonRecapEmailFormatter:
         if summary.playoffs:
             # Finals (show first - most recent)
             if summary.playoffs.finals:
-                html_content += f"""
-        <div class="playoff-bracket">
-            <h2>Finals - Week {summary.playoffs.finals.week}</h2>
-"""
-                for bracket in summary.playoffs.finals.division_brackets:
-                    html_content += f"""
-            <div class="playoff-division">
-                <h4>{bracket.division_name}</h4>
-"""
-                    for matchup in bracket.matchups:
-                        winner1 = (
-                            " playoff-winner" if matchup.winner_name == matchup.team1_name else ""
-                        )
-                        winner2 = (
-                            " playoff-winner" if matchup.winner_name == matchup.team2_name else ""
-                        )
-                        score1 = f"{matchup.score1:.2f}" if matchup.score1 is not None else "TBD"
-                        score2 = f"{matchup.score2:.2f}" if matchup.score2 is not None else "TBD"
-
-                        html_content += f"""
-                <div class="playoff-matchup">
-                    <div class="playoff-team{winner1}">
-                        #{matchup.seed1} {matchup.team1_name} ({matchup.owner1_name}) - {score1}
-                    </div>
-                    <div class="playoff-team{winner2}">
-                        #{matchup.seed2} {matchup.team2_name} ({matchup.owner2_name}) - {score2}
-                    </div>
-                </div>
-"""
-
-                    html_content += """
-            </div>
-"""
-
-                html_content += """
-        </div>
-"""
+                yield self._format_playoff_round("Finals", summary.playoffs.finals)
 
             # Semifinals (show second - earlier round)
             if summary.playoffs.semifinals:
-                html_content += f"""
-        <div class="playoff-bracket">
-            <h2>Semifinals - Week {summary.playoffs.semifinals.week}</h2>
-"""
-                for bracket in summary.playoffs.semifinals.division_brackets:
-                    html_content += f"""
-            <div class="playoff-division">
-                <h4>{bracket.division_name}</h4>
-"""
-                    for matchup in bracket.matchups:
-                        winner1 = (
-                            " playoff-winner" if matchup.winner_name == matchup.team1_name else ""
-                        )
-                        winner2 = (
-                            " playoff-winner" if matchup.winner_name == matchup.team2_name else ""
-                        )
-                        score1 = f"{matchup.score1:.2f}" if matchup.score1 is not None else "TBD"
-                        score2 = f"{matchup.score2:.2f}" if matchup.score2 is not None else "TBD"
-
-                        html_content += f"""
-                <div class="playoff-matchup">
-                    <div class="playoff-team{winner1}">
-                        #{matchup.seed1} {matchup.team1_name} ({matchup.owner1_name}) - {score1}
-                    </div>
-                    <div class="playoff-team{winner2}">
-                        #{matchup.seed2} {matchup.team2_name} ({matchup.owner2_name}) - {score2}
-                    </div>
-                </div>
-"""
-
-                    html_content += """
-            </div>
-"""
-
-                html_content += """
-        </div>
-"""
+                yield self._format_playoff_round("Semifinals", summary.playoffs.semifinals)
 
         # Regular season results
-        html_content += """
+        yield """
         <h2>Regular Season Results</h2>
 
         <div class="season-highlight">
@@ -446,18 +444,18 @@ class SeasonRecapEmailFormatter:
 """
 
         for champion in summary.regular_season.division_champions:
-            record = f"{champion.wins}-{champion.losses}"
-            html_content += f"""
+            record = champion.record
+            yield f"""
                     <tr>
-                        <td>{champion.division_name}</td>
-                        <td>{champion.team_name}</td>
-                        <td>{champion.owner_name}</td>
+                        <td>{esc(champion.division_name)}</td>
+                        <td>{esc(champion.team_name)}</td>
+                        <td>{esc(champion.owner_name)}</td>
                         <td>{record}</td>
                         <td class="number">{champion.points_for:.2f}</td>
                     </tr>
 """
 
-        html_content += """
+        yield """
                 </tbody>
             </table>
         </div>
@@ -478,17 +476,17 @@ class SeasonRecapEmailFormatter:
 """
 
         for challenge in summary.season_challenges:
-            html_content += f"""
+            yield f"""
                     <tr>
-                        <td>{challenge.challenge_name}</td>
-                        <td>{challenge.winner}</td>
-                        <td>{challenge.owner.full_name}</td>
-                        <td>{challenge.division}</td>
-                        <td>{challenge.value}</td>
+                        <td>{esc(challenge.challenge_name)}</td>
+                        <td>{esc(challenge.winner)}</td>
+                        <td>{esc(challenge.owner.full_name)}</td>
+                        <td>{esc(challenge.division)}</td>
+                        <td>{esc(challenge.value)}</td>
                     </tr>
 """
 
-        html_content += """
+        yield """
                 </tbody>
             </table>
         </div>
@@ -498,8 +496,8 @@ class SeasonRecapEmailFormatter:
 
         # Final standings by division
         for division_data in summary.regular_season.final_standings:
-            html_content += f"""
-        <h4>{division_data.name}</h4>
+            yield f"""
+        <h4>{esc(division_data.name)}</h4>
         <table>
             <thead>
                 <tr>
@@ -514,32 +512,27 @@ class SeasonRecapEmailFormatter:
             <tbody>
 """
 
-            # Sort teams
-            sorted_teams = sorted(
-                division_data.teams, key=lambda t: (t.wins, t.points_for), reverse=True
-            )
-
-            for rank, team in enumerate(sorted_teams, start=1):
-                record = f"{team.wins}-{team.losses}"
-                owner_name = f"{team.owner.first_name} {team.owner.last_name}"
-                html_content += f"""
+            for rank, team in enumerate(division_data.sorted_teams, start=1):
+                record = team.record
+                owner_name = team.owner.full_name
+                yield f"""
                 <tr>
                     <td>{rank}</td>
-                    <td>{team.name}</td>
-                    <td>{owner_name}</td>
+                    <td>{esc(team.name)}</td>
+                    <td>{esc(owner_name)}</td>
                     <td>{record}</td>
                     <td class="number">{team.points_for:.2f}</td>
                     <td class="number">{team.points_against:.2f}</td>
                 </tr>
 """
 
-            html_content += """
+            yield """
             </tbody>
         </table>
 """
 
         # Footer
-        html_content += f"""
+        yield f"""
         <div class="footer">
             Generated by Fantasy Football Challenge Tracker v{pkg_version}<br>
             <!-- GENERATED_METADATA_START --><!-- GENERATED_METADATA_END -->
@@ -549,4 +542,53 @@ class SeasonRecapEmailFormatter:
 </html>
 """
 
-        return html_content
+    def _format_playoff_round(self, title: str, playoff_round: PlayoffRound) -> str:
+        """
+        Format a single playoff round across all divisions as HTML.
+
+        Args:
+            title: Round heading, e.g. "Finals" or "Semifinals"
+            playoff_round: PlayoffRound with division brackets
+
+        Returns:
+            HTML string for the round's bracket section
+        """
+        esc = self._escape_html
+        parts: list[str] = []
+        append = parts.append
+
+        append(f"""
+        <div class="playoff-bracket">
+            <h2>{title} - Week {playoff_round.week}</h2>
+""")
+        for bracket in playoff_round.division_brackets:
+            append(f"""
+            <div class="playoff-division">
+                <h4>{esc(bracket.division_name)}</h4>
+""")
+            for matchup in bracket.matchups:
+                winner1 = " playoff-winner" if matchup.winner_name == matchup.team1_name else ""
+                winner2 = " playoff-winner" if matchup.winner_name == matchup.team2_name else ""
+                score1 = matchup.score1_display
+                score2 = matchup.score2_display
+
+                append(f"""
+                <div class="playoff-matchup">
+                    <div class="playoff-team{winner1}">
+                        #{matchup.seed1} {esc(matchup.team1_name)} ({esc(matchup.owner1_name)}) - {score1}
+                    </div>
+                    <div class="playoff-team{winner2}">
+                        #{matchup.seed2} {esc(matchup.team2_name)} ({esc(matchup.owner2_name)}) - {score2}
+                    </div>
+                </div>
+""")
+
+            append("""
+            </div>
+""")
+
+        append("""
+        </div>
+""")
+
+        return "".join(parts)
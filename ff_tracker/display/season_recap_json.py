@@ -8,9 +8,11 @@ playoffs, and championship results. Suitable for archival, APIs, and data analys
 from __future__ import annotations
 
 import json
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 from ..models.season_summary import SeasonSummary
+from .base import _parse_bool_arg
 
 
 class SeasonRecapJsonFormatter:
@@ -27,6 +29,9 @@ class SeasonRecapJsonFormatter:
         self.year = year
         self.format_args = format_args or {}
 
+        self._pretty = self._get_arg_bool("pretty", default=True)
+        self._note = self._get_arg("note")
+
     @classmethod
     def get_supported_args(cls) -> dict[str, str]:
         """Return supported format arguments for JSON formatter."""
@@ -61,10 +66,7 @@ class SeasonRecapJsonFormatter:
         Returns:
             Boolean value
         """
-        value = self._get_arg(key)
-        if value is None:
-            return default
-        return value.lower() in ("true", "1", "yes", "on")
+        return _parse_bool_arg(self._get_arg(key), default)
 
     def format(self, summary: SeasonSummary) -> str:
         """
@@ -76,9 +78,8 @@ class SeasonRecapJsonFormatter:
         Returns:
             JSON string representation
         """
-        # Get format arguments
-        pretty = self._get_arg_bool("pretty", default=True)
-        note = self._get_arg("note")
+        pretty = self._pretty
+        note = self._note
 
         # Build JSON structure
         data: dict[str, Any] = {
@@ -101,18 +102,17 @@ class SeasonRecapJsonFormatter:
 
         # Championship results (if available)
         if summary.championship:
-            championship_entries = []
-            for entry in summary.championship.entries:
-                championship_entries.append(
-                    {
-                        "rank": entry.rank,
-                        "team_name": entry.team_name,
-                        "owner_name": entry.owner_name,
-                        "division_name": entry.division_name,
-                        "score": entry.score,
-                        "is_champion": entry.rank == 1,
-                    }
-                )
+            championship_entries = [
+                {
+                    "rank": entry.rank,
+                    "team_name": entry.team_name,
+                    "owner_name": entry.owner_name,
+                    "division_name": entry.division_name,
+                    "score": entry.score,
+                    "is_champion": entry.is_champion,
+                }
+                for entry in summary.championship.entries
+            ]
 
             data["championship"] = {
                 "week": summary.championship.week,
@@ -144,75 +144,30 @@ class SeasonRecapJsonFormatter:
             data["playoffs"] = {"rounds": playoff_rounds}
 
         # Regular season results
-        regular_season_data: dict[str, Any] = {}
-
-        # Division champions
-        champions = []
-        for champion in summary.regular_season.division_champions:
-            champions.append(
-                {
-                    "division_name": champion.division_name,
-                    "team_name": champion.team_name,
-                    "owner_name": champion.owner_name,
-                    "wins": champion.wins,
-                    "losses": champion.losses,
-                    "points_for": champion.points_for,
-                }
-            )
-        regular_season_data["division_champions"] = champions
-
-        # Season challenges
-        challenges = []
-        for challenge in summary.season_challenges:
-            challenges.append(
-                {
-                    "challenge_name": challenge.challenge_name,
-                    "winner": challenge.winner,
-                    "owner_name": challenge.owner.full_name,
-                    "division": challenge.division,
-                    "value": challenge.value,
-                    "description": challenge.description,
-                }
-            )
-        regular_season_data["challenges"] = challenges
-
-        # Final standings by division
-        standings = []
-        for division_data in summary.regular_season.final_standings:
-            division_standings = {
-                "division_name": division_data.name,
-                "teams": [],
-            }
-
-            # Sort teams by wins (desc), then points_for (desc)
-            sorted_teams = sorted(
-                division_data.teams, key=lambda t: (t.wins, t.points_for), reverse=True
-            )
-
-            for rank, team in enumerate(sorted_teams, start=1):
-                division_standings["teams"].append(
-                    {
-                        "rank": rank,
-                        "team_name": team.name,
-                        "owner_name": team.owner.first_name + " " + team.owner.last_name,
-                        "wins": team.wins,
-                        "losses": team.losses,
-                        "points_for": team.points_for,
-                        "points_against": team.points_against,
-                    }
-                )
-
-            standings.append(division_standings)
-
-        regular_season_data["final_standings"] = standings
-
-        data["regular_season"] = regular_season_data
+        data["regular_season"] = self._build_regular_season(summary)
 
         # Generate JSON output
         if pretty:
             return json.dumps(data, indent=2)
         return json.dumps(data)
 
+    def format_many(self, summaries: Iterable[SeasonSummary]) -> Iterator[str]:
+        """
+        Format several season summaries as JSON, one document per summary.
+
+        Documents are yielded one at a time so callers can write each to
+        disk without holding every rendered summary in memory.
+
+        Args:
+            summaries: Season summaries to format
+
+        Yields:
+            JSON string for each summary, in input order
+        """
+        fmt = self.format
+        for summary in summaries:
+            yield fmt(summary)
+
     def _format_playoff_round(self, playoff_round) -> dict[str, Any]:
         """
         Format a single playoff round as JSON.
@@ -223,45 +178,95 @@ class SeasonRecapJsonFormatter:
         Returns:
             Dictionary representation of playoff round
         """
-        round_data: dict[str, Any] = {
+        return {
             "round_name": playoff_round.round_name,
             "week": playoff_round.week,
-            "divisions": [],
+            "divisions": [
+                {
+                    "division_name": bracket.division_name,
+                    "matchups": [
+                        {
+                            "matchup_id": matchup.matchup_id,
+                            "round_name": matchup.round_name,
+                            "team1": {
+                                "seed": matchup.seed1,
+                                "team_name": matchup.team1_name,
+                                "owner_name": matchup.owner1_name,
+                                "score": matchup.score1,
+                            },
+                            "team2": {
+                                "seed": matchup.seed2,
+                                "team_name": matchup.team2_name,
+                                "owner_name": matchup.owner2_name,
+                                "score": matchup.score2,
+                            },
+                            "winner": {
+                                "team_name": matchup.winner_name,
+                                "seed": matchup.winner_seed,
+                            }
+                            if matchup.winner_name
+                            else None,
+                            "is_complete": matchup.winner_name is not None,
+                        }
+                        for matchup in bracket.matchups
+                    ],
+                }
+                for bracket in playoff_round.division_brackets
+            ],
         }
 
-        for bracket in playoff_round.division_brackets:
-            division_data: dict[str, Any] = {
-                "division_name": bracket.division_name,
-                "matchups": [],
-            }
-
-            for matchup in bracket.matchups:
-                matchup_data = {
-                    "matchup_id": matchup.matchup_id,
-                    "round_name": matchup.round_name,
-                    "team1": {
-                        "seed": matchup.seed1,
-                        "team_name": matchup.team1_name,
-                        "owner_name": matchup.owner1_name,
-                        "score": matchup.score1,
-                    },
-                    "team2": {
-                        "seed": matchup.seed2,
-                        "team_name": matchup.team2_name,
-                        "owner_name": matchup.owner2_name,
-                        "score": matchup.score2,
-                    },
-                    "winner": {
-                        "team_name": matchup.winner_name,
-                        "seed": matchup.winner_seed,
-                    }
-                    if matchup.winner_name
-                    else None,
-                    "is_complete": matchup.winner_name is not None,
-                }
+    def _build_regular_season(self, summary: SeasonSummary) -> dict[str, Any]:
+        """
+        Format regular season results as JSON.
 
-                division_data["matchups"].append(matchup_data)
+        Args:
+            summary: Complete season summary data
 
-            round_data["divisions"].append(division_data)
+        Returns:
+            Dictionary with division champions, season challenges and final standings
+        """
+        regular_season = summary.regular_season
 
-        return round_data
+        return {
+            "division_champions": [
+                {
+                    "division_name": champion.division_name,
+                    "team_name": champion.team_name,
+                    "owner_name": champion.owner_name,
+                    "wins": champion.wins,
+                    "losses": champion.losses,
+                    "points_for": champion.points_for,
+                }
+                for champion in regular_season.division_champions
+            ],
+            "challenges": [
+                {
+                    "challenge_name": challenge.challenge_name,
+                    "winner": challenge.winner,
+                    "owner_name": challenge.owner.full_name,
+                    "division": challenge.division,
+                    "value": challenge.value,
+                    "description": challenge.description,
+                }
+                for challenge in summary.season_challenges
+            ],
+            # Teams sorted by wins (desc), then points_for (desc)
+            "final_standings": [
+                {
+                    "division_name": division_data.name,
+                    "teams": [
+                        {
+                            "rank": rank,
+                            "team_name": team.name,
+                            "owner_name": team.owner.full_name,
+                            "wins": team.wins,
+                            "losses": team.losses,
+                            "points_for": team.points_for,
+                            "points_against": team.points_against,
+                        }
+                        for rank, team in enumerate(division_data.sorted_teams, start=1)
+                    ],
+                }
+                for division_data in regular_season.final_standings
+            ],
+        }
@@ -7,7 +7,44 @@ and other platforms supporting Markdown rendering.
 
 from __future__ import annotations
 
-from ..models.season_summary import SeasonSummary
+from ..models.playoff import PlayoffMatchup
+from ..models.season_summary import PlayoffRound, SeasonSummary
+from .base import _parse_bool_arg
+
+# Table of contents lines, keyed by (has_championship, has_playoffs)
+_TOC_LINES = {
+    (has_championship, has_playoffs): (
+        "## Table of Contents",
+        "",
+        *(("- [Championship Week](#championship-week)",) if has_championship else ()),
+        *(("- [Playoff Results](#playoff-results)",) if has_playoffs else ()),
+        "- [Regular Season Results](#regular-season-results)",
+        "  - [Regular Season Division Champions](#regular-season-division-champions)",
+        "  - [Season-Long Challenges](#season-long-challenges)",
+        "  - [Final Standings](#final-standings)",
+        "",
+    )
+    for has_championship in (False, True)
+    for has_playoffs in (False, True)
+}
+
+# Static table headers (header row + separator row)
+_CHAMPIONSHIP_HEADER = (
+    "| Rank | Team | Owner | Division | Score |",
+    "|------|------|-------|----------|-------|",
+)
+_DIVISION_CHAMPIONS_HEADER = (
+    "| Division | Team | Owner | Record | Points For |",
+    "|----------|------|-------|--------|------------|",
+)
+_CHALLENGE_HEADER = (
+    "| Challenge | Winner | Owner | Division | Value |",
+    "|-----------|--------|-------|----------|-------|",
+)
+_STANDINGS_HEADER = (
+    "| Rank | Team | Owner | Record | PF | PA |",
+    "|------|------|-------|--------|----|----|",
+)
 
 
 class SeasonRecapMarkdownFormatter:
@@ -24,6 +61,9 @@ class SeasonRecapMarkdownFormatter:
         self.year = year
         self.format_args = format_args or {}
 
+        self._include_toc = self._get_arg_bool("include_toc", default=False)
+        self._note = self._get_arg("note")
+
     @classmethod
     def get_supported_args(cls) -> dict[str, str]:
         """Return supported format arguments for markdown formatter."""
@@ -58,10 +98,7 @@ class SeasonRecapMarkdownFormatter:
         Returns:
             Boolean value
         """
-        value = self._get_arg(key)
-        if value is None:
-            return default
-        return value.lower() in ("true", "1", "yes", "on")
+        return _parse_bool_arg(self._get_arg(key), default)
 
     def format(self, summary: SeasonSummary) -> str:
         """
@@ -73,181 +110,161 @@ class SeasonRecapMarkdownFormatter:
         Returns:
             Markdown formatted string
         """
-        # Get format arguments
-        include_toc = self._get_arg_bool("include_toc", default=False)
-        note = self._get_arg("note")
+        include_toc = self._include_toc
+        note = self._note
+        structure = summary.structure
+        championship = summary.championship
+        playoffs = summary.playoffs
+        regular_season = summary.regular_season
 
         lines: list[str] = []
+        append = lines.append
 
         # Title
-        lines.append(f"# 🏆 {self.year} Season Recap")
-        lines.append("")
+        lines.extend((f"# 🏆 {self.year} Season Recap", ""))
 
         # Optional note
         if note:
-            lines.append(f"> ⚠️ **{note}**")
-            lines.append("")
+            lines.extend((f"> ⚠️ **{note}**", ""))
 
         # Season info
-        lines.append(f"**Divisions:** {summary.total_divisions}")
-        lines.append(
-            f"**Regular Season:** Weeks {summary.structure.regular_season_start}-{summary.structure.regular_season_end}"
+        append(f"**Divisions:** {summary.total_divisions}")
+        append(
+            f"**Regular Season:** Weeks {structure.regular_season_start}-{structure.regular_season_end}"
         )
-        if summary.playoffs:
-            lines.append(
-                f"**Playoffs:** Weeks {summary.structure.playoff_start}-{summary.structure.playoff_end}"
-            )
-        if summary.championship:
-            lines.append(f"**Championship:** Week {summary.structure.championship_week}")
-        lines.append("")
+        if playoffs:
+            append(f"**Playoffs:** Weeks {structure.playoff_start}-{structure.playoff_end}")
+        if championship:
+            append(f"**Championship:** Week {structure.championship_week}")
+        append("")
 
         # Table of Contents (optional)
         if include_toc:
-            lines.append("## Table of Contents")
-            lines.append("")
-            if summary.championship:
-                lines.append("- [Championship Week](#championship-week)")
-            if summary.playoffs:
-                lines.append("- [Playoff Results](#playoff-results)")
-            lines.append("- [Regular Season Results](#regular-season-results)")
-            lines.append(
-                "  - [Regular Season Division Champions](#regular-season-division-champions)"
-            )
-            lines.append("  - [Season-Long Challenges](#season-long-challenges)")
-            lines.append("  - [Final Standings](#final-standings)")
-            lines.append("")
+            lines.extend(_TOC_LINES[bool(championship), bool(playoffs)])
 
         # Championship results (if available)
-        if summary.championship:
-            lines.append("## Championship Week")
-            lines.append("")
-            lines.append(
-                f"**Week {summary.structure.championship_week} - Division Winners Compete for Overall Title**"
+        if championship:
+            lines.extend(("## Championship Week", ""))
+            append(
+                f"**Week {structure.championship_week} - Division Winners Compete for Overall Title**"
             )
-            lines.append("")
-            lines.append("| Rank | Team | Owner | Division | Score |")
-            lines.append("|------|------|-------|----------|-------|")
-            for entry in summary.championship.entries:
-                champion_marker = "🏆 " if entry.rank == 1 else ""
-                lines.append(
+            append("")
+            lines.extend(_CHAMPIONSHIP_HEADER)
+            for entry in championship.entries:
+                champion_marker = "🏆 " if entry.is_champion else ""
+                append(
                     f"| {entry.rank} | {champion_marker}{entry.team_name} | {entry.owner_name} | "
                     f"{entry.division_name} | {entry.score:.2f} |"
                 )
-            lines.append("")
-
-            if summary.overall_champion:
-                lines.append(f"### 🎉 Season Champion: {summary.overall_champion.team_name}")
-                lines.append("")
-                lines.append(
-                    f"**{summary.overall_champion.owner_name}** from **{summary.overall_champion.division_name}** "
-                    f"won with **{summary.overall_champion.score:.2f} points**!"
+            append("")
+
+            overall_champion = summary.overall_champion
+            if overall_champion:
+                lines.extend((f"### 🎉 Season Champion: {overall_champion.team_name}", ""))
+                append(
+                    f"**{overall_champion.owner_name}** from **{overall_champion.division_name}** "
+                    f"won with **{overall_champion.score:.2f} points**!"
                 )
-                lines.append("")
+                append("")
 
         # Playoff results
-        if summary.playoffs:
-            lines.append("## Playoff Results")
-            lines.append("")
+        if playoffs:
+            lines.extend(("## Playoff Results", ""))
 
             # Finals (show first - most recent)
-            if summary.playoffs.finals:
-                lines.append(f"### Finals - Week {summary.playoffs.finals.week}")
-                lines.append("")
-                for bracket in summary.playoffs.finals.division_brackets:
-                    lines.append(f"**{bracket.division_name}**")
-                    lines.append("")
-                    for idx, matchup in enumerate(bracket.matchups):
-                        winner1 = "✅ " if matchup.winner_name == matchup.team1_name else ""
-                        winner2 = "✅ " if matchup.winner_name == matchup.team2_name else ""
-                        score1 = f"{matchup.score1:.2f}" if matchup.score1 is not None else "TBD"
-                        score2 = f"{matchup.score2:.2f}" if matchup.score2 is not None else "TBD"
-                        lines.append(
-                            f"- {winner1}**#{matchup.seed1} {matchup.team1_name}** ({matchup.owner1_name}) - {score1}"
-                        )
-                        lines.append(
-                            f"- {winner2}**#{matchup.seed2} {matchup.team2_name}** ({matchup.owner2_name}) - {score2}"
-                        )
-                        if matchup.winner_name:
-                            lines.append(f"  - **Winner:** {matchup.winner_name}")
-                        lines.append("")
-                        # Add extra blank line between matchups for better separation
-                        if idx < len(bracket.matchups) - 1:
-                            lines.append("")
+            if playoffs.finals:
+                lines.extend(self._playoff_round_lines("Finals", playoffs.finals))
 
             # Semifinals (show second - earlier round)
-            if summary.playoffs.semifinals:
-                lines.append(f"### Semifinals - Week {summary.playoffs.semifinals.week}")
-                lines.append("")
-                for bracket in summary.playoffs.semifinals.division_brackets:
-                    lines.append(f"**{bracket.division_name}**")
-                    lines.append("")
-                    for idx, matchup in enumerate(bracket.matchups):
-                        winner1 = "✅ " if matchup.winner_name == matchup.team1_name else ""
-                        winner2 = "✅ " if matchup.winner_name == matchup.team2_name else ""
-                        score1 = f"{matchup.score1:.2f}" if matchup.score1 is not None else "TBD"
-                        score2 = f"{matchup.score2:.2f}" if matchup.score2 is not None else "TBD"
-                        lines.append(
-                            f"- {winner1}**#{matchup.seed1} {matchup.team1_name}** ({matchup.owner1_name}) - {score1}"
-                        )
-                        lines.append(
-                            f"- {winner2}**#{matchup.seed2} {matchup.team2_name}** ({matchup.owner2_name}) - {score2}"
-                        )
-                        if matchup.winner_name:
-                            lines.append(f"  - **Winner:** {matchup.winner_name}")
-                        lines.append("")
-                        # Add extra blank line between matchups for better separation
-                        if idx < len(bracket.matchups) - 1:
-                            lines.append("")
+            if playoffs.semifinals:
+                lines.extend(self._playoff_round_lines("Semifinals", playoffs.semifinals))
 
         # Regular season results
-        lines.append("## Regular Season Results")
-        lines.append("")
+        lines.extend(("## Regular Season Results", ""))
 
         # Regular Season Division Champions
-        lines.append("### Regular Season Division Champions")
-        lines.append("")
-        lines.append("| Division | Team | Owner | Record | Points For |")
-        lines.append("|----------|------|-------|--------|------------|")
-        for champion in summary.regular_season.division_champions:
-            record = f"{champion.wins}-{champion.losses}"
-            lines.append(
+        lines.extend(("### Regular Season Division Champions", ""))
+        lines.extend(_DIVISION_CHAMPIONS_HEADER)
+        for champion in regular_season.division_champions:
+            record = champion.record
+            append(
                 f"| {champion.division_name} | {champion.team_name} | {champion.owner_name} | "
                 f"{record} | {champion.points_for:.2f} |"
             )
-        lines.append("")
+        append("")
 
         # Season challenges
-        lines.append("### Season-Long Challenges")
-        lines.append("")
-        lines.append("| Challenge | Winner | Owner | Division | Value |")
-        lines.append("|-----------|--------|-------|----------|-------|")
+        lines.extend(("### Season-Long Challenges", ""))
+        lines.extend(_CHALLENGE_HEADER)
         for challenge in summary.season_challenges:
-            lines.append(
+            append(
                 f"| {challenge.challenge_name} | {challenge.winner} | {challenge.owner.full_name} | {challenge.division} | {challenge.value} |"
             )
-        lines.append("")
+        append("")
 
         # Final standings by division
-        lines.append("### Final Standings")
-        lines.append("")
-        for division_data in summary.regular_season.final_standings:
-            lines.append(f"#### {division_data.name}")
-            lines.append("")
-            lines.append("| Rank | Team | Owner | Record | PF | PA |")
-            lines.append("|------|------|-------|--------|----|----|")
-
-            # Sort teams
-            sorted_teams = sorted(
-                division_data.teams, key=lambda t: (t.wins, t.points_for), reverse=True
-            )
-
-            for rank, team in enumerate(sorted_teams, start=1):
-                record = f"{team.wins}-{team.losses}"
-                owner_name = f"{team.owner.first_name} {team.owner.last_name}"
-                lines.append(
-                    f"| {rank} | {team.name} | {owner_name} | {record} | "
+        lines.extend(("### Final Standings", ""))
+        for division_data in regular_season.final_standings:
+            lines.extend((f"#### {division_data.name}", ""))
+            lines.extend(_STANDINGS_HEADER)
+
+            for rank, team in enumerate(division_data.sorted_teams, start=1):
+                append(
+                    f"| {rank} | {team.name} | {team.owner.full_name} | {team.record} | "
                     f"{team.points_for:.2f} | {team.points_against:.2f} |"
                 )
-            lines.append("")
+            append("")
 
         return "\n".join(lines)
+
+    def _playoff_round_lines(self, title: str, playoff_round: PlayoffRound) -> list[str]:
+        """
+        Build the Markdown lines for a single playoff round across all divisions.
+
+        Args:
+            title: Section title (e.g. "Finals")
+            playoff_round: PlayoffRound with matchups
+
+        Returns:
+            Playoff round lines, joined once by the caller
+        """
+        lines = [f"### {title} - Week {playoff_round.week}", ""]
+
+        for bracket in playoff_round.division_brackets:
+            lines.extend((f"**{bracket.division_name}**", ""))
+
+            for idx, matchup in enumerate(bracket.matchups):
+                # Add extra blank line between matchups for better separation
+                if idx:
+                    lines.append("")
+                lines.extend(self._playoff_matchup_lines(matchup))
+
+        return lines
+
+    def _playoff_matchup_lines(self, matchup: PlayoffMatchup) -> list[str]:
+        """
+        Build the Markdown lines for a single playoff matchup.
+
+        Args:
+            matchup: PlayoffMatchup data
+
+        Returns:
+            Two team lines, a winner line once the game is complete, and a blank line
+        """
+        winner = matchup.winner_name
+        team1, team2 = matchup.team1_name, matchup.team2_name
+
+        winner1 = "✅ " if winner == team1 else ""
+        winner2 = "✅ " if winner == team2 else ""
+        score1 = matchup.score1_display
+        score2 = matchup.score2_display
+
+        lines = [
+            f"- {winner1}**#{matchup.seed1} {team1}** ({matchup.owner1_name}) - {score1}",
+            f"- {winner2}**#{matchup.seed2} {team2}** ({matchup.owner2_name}) - {score2}",
+        ]
+        if winner:
+            lines.append(f"  - **Winner:** {winner}")
+        lines.append("")
+
+        return lines
@@ -7,7 +7,14 @@ optimized for spreadsheet analysis and record-keeping.
 
 from __future__ import annotations
 
-from ..models.season_summary import SeasonSummary
+from ..models.playoff import PlayoffMatchup
+from ..models.season_summary import PlayoffRound, SeasonSummary
+
+# Static table header rows
+_CHAMPIONSHIP_HEADER = "Rank\tTeam\tOwner\tDivision\tScore"
+_DIVISION_CHAMPIONS_HEADER = "Division\tTeam\tOwner\tRecord\tPoints For"
+_CHALLENGE_HEADER = "Challenge\tWinner\tOwner\tDivision\tValue"
+_STANDINGS_HEADER = "Rank\tTeam\tOwner\tRecord\tPoints For\tPoints Against"
 
 
 class SeasonRecapSheetsFormatter:
@@ -24,6 +31,8 @@ class SeasonRecapSheetsFormatter:
         self.year = year
         self.format_args = format_args or {}
 
+        self._note = self._get_arg("note")
+
     @classmethod
     def get_supported_args(cls) -> dict[str, str]:
         """Return supported format arguments for sheets formatter."""
@@ -54,124 +63,132 @@ class SeasonRecapSheetsFormatter:
         Returns:
             TSV string suitable for Google Sheets
         """
-        # Get format arguments
-        note = self._get_arg("note")
+        note = self._note
+        structure = summary.structure
+        championship = summary.championship
+        playoffs = summary.playoffs
+        regular_season = summary.regular_season
 
         lines: list[str] = []
+        append = lines.append
 
         # Optional note row
         if note:
-            lines.append(f"NOTE:\t{note}")
-            lines.append("")  # Blank line
+            lines.extend((f"NOTE:\t{note}", ""))  # Followed by a blank line
 
         # Header section
-        lines.append(f"SEASON RECAP\t{self.year}")
-        lines.append(f"Divisions\t{summary.total_divisions}")
-        lines.append(
-            f"Regular Season\tWeeks {summary.structure.regular_season_start}-{summary.structure.regular_season_end}"
+        append(f"SEASON RECAP\t{self.year}")
+        append(f"Divisions\t{summary.total_divisions}")
+        append(
+            f"Regular Season\tWeeks {structure.regular_season_start}-{structure.regular_season_end}"
         )
-        if summary.playoffs:
-            lines.append(
-                f"Playoffs\tWeeks {summary.structure.playoff_start}-{summary.structure.playoff_end}"
-            )
-        if summary.championship:
-            lines.append(f"Championship\tWeek {summary.structure.championship_week}")
-        lines.append("")  # Blank line
+        if playoffs:
+            append(f"Playoffs\tWeeks {structure.playoff_start}-{structure.playoff_end}")
+        if championship:
+            append(f"Championship\tWeek {structure.championship_week}")
+        append("")  # Blank line
 
         # Championship results (if available)
-        if summary.championship:
-            lines.append(f"CHAMPIONSHIP WEEK {summary.structure.championship_week}")
-            lines.append("Rank\tTeam\tOwner\tDivision\tScore")
-            for entry in summary.championship.entries:
-                champion_marker = "🏆 " if entry.rank == 1 else ""
-                lines.append(
+        if championship:
+            append(f"CHAMPIONSHIP WEEK {structure.championship_week}")
+            append(_CHAMPIONSHIP_HEADER)
+            for entry in championship.entries:
+                champion_marker = "🏆 " if entry.is_champion else ""
+                append(
                     f"{entry.rank}\t{champion_marker}{entry.team_name}\t{entry.owner_name}\t"
                     f"{entry.division_name}\t{entry.score:.2f}"
                 )
-            lines.append("")  # Blank line
+            append("")  # Blank line
 
         # Playoff results (reverse chronological: Finals → Semifinals)
-        if summary.playoffs:
+        if playoffs:
             # Finals (show first - most recent)
-            if summary.playoffs.finals:
-                lines.append(f"FINALS\tWeek {summary.playoffs.finals.week}")
-                for bracket in summary.playoffs.finals.division_brackets:
-                    lines.append(f"Division\t{bracket.division_name}")
-                    for matchup in bracket.matchups:
-                        winner_marker1 = "✓" if matchup.winner_name == matchup.team1_name else ""
-                        winner_marker2 = "✓" if matchup.winner_name == matchup.team2_name else ""
-                        score1 = f"{matchup.score1:.2f}" if matchup.score1 is not None else "TBD"
-                        score2 = f"{matchup.score2:.2f}" if matchup.score2 is not None else "TBD"
-                        lines.append(
-                            f"#{matchup.seed1} {winner_marker1}\t{matchup.team1_name}\t{matchup.owner1_name}\t{score1}"
-                        )
-                        lines.append(
-                            f"#{matchup.seed2} {winner_marker2}\t{matchup.team2_name}\t{matchup.owner2_name}\t{score2}"
-                        )
-                        lines.append("")  # Blank line between matchups
-                lines.append("")  # Blank line
+            if playoffs.finals:
+                lines.extend(self._playoff_round_lines("FINALS", playoffs.finals))
 
             # Semifinals (show second - earlier round)
-            if summary.playoffs.semifinals:
-                lines.append(f"SEMIFINALS\tWeek {summary.playoffs.semifinals.week}")
-                for bracket in summary.playoffs.semifinals.division_brackets:
-                    lines.append(f"Division\t{bracket.division_name}")
-                    for matchup in bracket.matchups:
-                        winner_marker1 = "✓" if matchup.winner_name == matchup.team1_name else ""
-                        winner_marker2 = "✓" if matchup.winner_name == matchup.team2_name else ""
-                        score1 = f"{matchup.score1:.2f}" if matchup.score1 is not None else "TBD"
-                        score2 = f"{matchup.score2:.2f}" if matchup.score2 is not None else "TBD"
-                        lines.append(
-                            f"#{matchup.seed1} {winner_marker1}\t{matchup.team1_name}\t{matchup.owner1_name}\t{score1}"
-                        )
-                        lines.append(
-                            f"#{matchup.seed2} {winner_marker2}\t{matchup.team2_name}\t{matchup.owner2_name}\t{score2}"
-                        )
-                        lines.append("")  # Blank line between matchups
-                lines.append("")  # Blank line
+            if playoffs.semifinals:
+                lines.extend(self._playoff_round_lines("SEMIFINALS", playoffs.semifinals))
 
         # Regular season results
-        lines.append("REGULAR SEASON RESULTS")
-        lines.append("")  # Blank line
+        lines.extend(("REGULAR SEASON RESULTS", ""))  # Followed by a blank line
 
         # Regular Season Division Champions
-        lines.append("REGULAR SEASON DIVISION CHAMPIONS")
-        lines.append("Division\tTeam\tOwner\tRecord\tPoints For")
-        for champion in summary.regular_season.division_champions:
-            record = f"{champion.wins}-{champion.losses}"
-            lines.append(
+        append("REGULAR SEASON DIVISION CHAMPIONS")
+        append(_DIVISION_CHAMPIONS_HEADER)
+        for champion in regular_season.division_champions:
+            record = champion.record
+            append(
                 f"{champion.division_name}\t{champion.team_name}\t{champion.owner_name}\t"
                 f"{record}\t{champion.points_for:.2f}"
             )
-        lines.append("")  # Blank line
+        append("")  # Blank line
 
         # Season challenges
-        lines.append("SEASON-LONG CHALLENGES")
-        lines.append("Challenge\tWinner\tOwner\tDivision\tValue")
+        append("SEASON-LONG CHALLENGES")
+        append(_CHALLENGE_HEADER)
         for challenge in summary.season_challenges:
-            lines.append(
+            append(
                 f"{challenge.challenge_name}\t{challenge.winner}\t{challenge.owner.full_name}\t{challenge.division}\t{challenge.value}"
             )
-        lines.append("")  # Blank line
+        append("")  # Blank line
 
         # Final standings by division
-        lines.append("FINAL STANDINGS")
-        for division_data in summary.regular_season.final_standings:
-            lines.append(f"Division\t{division_data.name}")
-            lines.append("Rank\tTeam\tOwner\tRecord\tPoints For\tPoints Against")
-
-            # Sort teams
-            sorted_teams = sorted(
-                division_data.teams, key=lambda t: (t.wins, t.points_for), reverse=True
-            )
-
-            for rank, team in enumerate(sorted_teams, start=1):
-                record = f"{team.wins}-{team.losses}"
-                owner_name = f"{team.owner.first_name} {team.owner.last_name}"
-                lines.append(
-                    f"{rank}\t{team.name}\t{owner_name}\t{record}\t"
+        append("FINAL STANDINGS")
+        for division_data in regular_season.final_standings:
+            append(f"Division\t{division_data.name}")
+            append(_STANDINGS_HEADER)
+
+            for rank, team in enumerate(division_data.sorted_teams, start=1):
+                append(
+                    f"{rank}\t{team.name}\t{team.owner.full_name}\t{team.record}\t"
                     f"{team.points_for:.2f}\t{team.points_against:.2f}"
                 )
-            lines.append("")  # Blank line
+            append("")  # Blank line
 
         return "\n".join(lines)
+
+    def _playoff_round_lines(self, title: str, playoff_round: PlayoffRound) -> list[str]:
+        """
+        Build the TSV rows for a single playoff round across all divisions.
+
+        Args:
+            title: Section title (e.g. "FINALS")
+            playoff_round: PlayoffRound with matchups
+
+        Returns:
+            Playoff round rows, joined once by the caller
+        """
+        lines = [f"{title}\tWeek {playoff_round.week}"]
+
+        for bracket in playoff_round.division_brackets:
+            lines.append(f"Division\t{bracket.division_name}")
+            for matchup in bracket.matchups:
+                lines.extend(self._playoff_matchup_lines(matchup))
+        lines.append("")  # Blank line
+
+        return lines
+
+    def _playoff_matchup_lines(self, matchup: PlayoffMatchup) -> tuple[str, str, str]:
+        """
+        Build the TSV rows for a single playoff matchup.
+
+        Args:
+            matchup: PlayoffMatchup data
+
+        Returns:
+            Two team rows followed by a blank separator row
+        """
+        winner = matchup.winner_name
+        team1, team2 = matchup.team1_name, matchup.team2_name
+
+        winner_marker1 = "✓" if winner == team1 else ""
+        winner_marker2 = "✓" if winner == team2 else ""
+        score1 = matchup.score1_display
+        score2 = matchup.score2_display
+
+        return (
+            f"#{matchup.seed1} {winner_marker1}\t{team1}\t{matchup.owner1_name}\t{score1}",
+            f"#{matchup.seed2} {winner_marker2}\t{team2}\t{matchup.owner2_name}\t{score2}",
+            "",  # Blank line between matchups
+        )
@@ -6,11 +6,28 @@ Provides tab-separated values output suitable for copying into Google Sheets.
 
 from __future__ import annotations
 
-from collections.abc import Sequence
-
-from ..models import ChallengeResult, ChampionshipLeaderboard, DivisionData, WeeklyChallenge
+from collections.abc import Iterator, Sequence
+from typing import TextIO
+
+from ..models import (
+    ChallengeResult,
+    ChampionshipLeaderboard,
+    DivisionData,
+    WeeklyChallenge,
+    split_weekly_challenges,
+)
 from ..models.championship import ChampionshipRoster
-from .base import BaseFormatter
+from .base import _RANK_MEDALS, BaseFormatter
+
+# Static table header rows
+_PLAYOFF_BRACKET_HEADER = "Matchup\tSeed\tTeam\tOwner\tScore\tResult"
+_CHAMPIONSHIP_HEADER = "Rank\tMedal\tTeam\tOwner\tDivision\tScore"
+_ROSTER_STARTERS_HEADER = "Status\tPos\tPlayer\tTeam\tPoints"
+_WEEKLY_TEAM_HEADER = "Challenge\tTeam\tDivision\tValue"
+_WEEKLY_PLAYER_HEADER = "Challenge\tPlayer\tPoints"
+_CHALLENGE_HEADER = "Challenge\tWinner\tOwner\tDivision\tDetails"
+_DIVISION_HEADER = "Rank\tTeam\tOwner\tPoints For\tPoints Against\tRecord\tPlayoffs"
+_OVERALL_HEADER = "Rank\tTeam\tOwner\tDivision\tPoints For\tPoints Against\tRecord\tPlayoffs"
 
 
 class SheetsFormatter(BaseFormatter):
@@ -26,6 +43,8 @@ class SheetsFormatter(BaseFormatter):
         """
         super().__init__(year, format_args)
 
+        self._note = self._get_arg("note")
+
     @classmethod
     def get_supported_args(cls) -> dict[str, str]:
         """Return supported format arguments for sheets formatter."""
@@ -43,10 +62,57 @@ class SheetsFormatter(BaseFormatter):
         championship_rosters: Sequence[ChampionshipRoster] | None = None,
     ) -> str:
         """Format complete output for Google Sheets TSV."""
-        output_lines: list[str] = []
+        return "\n".join(
+            self._iter_lines(
+                divisions,
+                challenges,
+                weekly_challenges,
+                current_week,
+                championship,
+                championship_rosters,
+            )
+        )
+
+    def format_to(
+        self,
+        divisions: Sequence[DivisionData],
+        challenges: Sequence[ChallengeResult],
+        weekly_challenges: Sequence[WeeklyChallenge] | None = None,
+        current_week: int | None = None,
+        championship: ChampionshipLeaderboard | None = None,
+        championship_rosters: Sequence[ChampionshipRoster] | None = None,
+        *,
+        out: TextIO,
+    ) -> None:
+        """
+        Write the TSV output to a file-like object.
 
-        # Get format arguments
-        note = self._get_arg("note")
+        Lines are written as they are rendered, each terminated by a newline,
+        so the full output is never held in memory as a single string.
+        """
+        out.writelines(
+            f"{line}\n"
+            for line in self._iter_lines(
+                divisions,
+                challenges,
+                weekly_challenges,
+                current_week,
+                championship,
+                championship_rosters,
+            )
+        )
+
+    def _iter_lines(
+        self,
+        divisions: Sequence[DivisionData],
+        challenges: Sequence[ChallengeResult],
+        weekly_challenges: Sequence[WeeklyChallenge] | None = None,
+        current_week: int | None = None,
+        championship: ChampionshipLeaderboard | None = None,
+        championship_rosters: Sequence[ChampionshipRoster] | None = None,
+    ) -> Iterator[str]:
+        """Render the TSV output one line at a time."""
+        note = self._note
 
         # Detect playoff mode
         is_playoff_mode = any(d.is_playoff_mode for d in divisions)
@@ -54,157 +120,138 @@ class SheetsFormatter(BaseFormatter):
 
         # Optional note (first row if present)
         if note:
-            output_lines.append(f"📢 NOTE: {note}")
-            output_lines.append("")
+            yield f"📢 NOTE: {note}"
+            yield ""
 
         # Header
         total_divisions, total_teams = self._calculate_total_stats(divisions)
-        output_lines.append(f"Fantasy Football Multi-Division Challenge Tracker ({self.year})")
-        output_lines.append(f"{total_divisions} divisions, {total_teams} teams total")
+        yield f"Fantasy Football Multi-Division Challenge Tracker ({self.year})"
+        yield f"{total_divisions} divisions, {total_teams} teams total"
 
         if current_week is not None:
-            output_lines.append(f"Current Week: {current_week}")
+            yield f"Current Week: {current_week}"
 
-        output_lines.append("")
+        yield ""
 
         # Championship leaderboard (first, if championship week)
         if is_championship_week and championship:
-            output_lines.extend(
-                self._format_championship_leaderboard(championship, championship_rosters)
-            )
-            output_lines.append("")
+            yield from self._format_championship_leaderboard(championship, championship_rosters)
+            yield ""
             # Add detailed rosters if available
             if championship_rosters:
-                output_lines.extend(self._format_championship_rosters(championship_rosters))
-                output_lines.append("")
+                yield from self._format_championship_rosters(championship_rosters)
+                yield ""
 
         # Playoff brackets (first, if Semifinals/Finals)
         if is_playoff_mode and not is_championship_week:
-            output_lines.extend(self._format_playoff_brackets(divisions))
-            output_lines.append("")
+            yield from self._format_playoff_brackets(divisions)
+            yield ""
 
         # Weekly player highlights (playoffs only show player challenges)
         if weekly_challenges and current_week:
             if is_playoff_mode or is_championship_week:
                 # Filter to player challenges only
-                player_challenges = [
-                    c for c in weekly_challenges if "position" in c.additional_info
-                ]
+                player_challenges = [c for c in weekly_challenges if c.is_player_highlight]
                 if player_challenges:
-                    output_lines.extend(
-                        self._format_weekly_player_table(player_challenges, current_week)
-                    )
-                    output_lines.append("")
+                    yield from self._format_weekly_player_table(player_challenges, current_week)
+                    yield ""
             else:
                 # Regular season: show both team and player challenges
-                team_challenges = [
-                    c for c in weekly_challenges if "position" not in c.additional_info
-                ]
-                player_challenges = [
-                    c for c in weekly_challenges if "position" in c.additional_info
-                ]
+                team_challenges, player_challenges = split_weekly_challenges(weekly_challenges)
 
-                output_lines.append(f"WEEK {current_week} HIGHLIGHTS")
-                output_lines.append("")
+                yield f"WEEK {current_week} HIGHLIGHTS"
+                yield ""
 
                 # Team challenges
                 if team_challenges:
-                    output_lines.append("Team Challenges")
-                    output_lines.append("Challenge\tTeam\tDivision\tValue")
+                    yield "Team Challenges"
+                    yield _WEEKLY_TEAM_HEADER
 
                     for challenge in team_challenges:
-                        output_lines.append(
+                        yield (
                             f"{challenge.challenge_name}\t{challenge.winner}\t{challenge.division}\t"
                             f"{challenge.value}"
                         )
 
-                    output_lines.append("")
+                    yield ""
 
                 # Player highlights
                 if player_challenges:
-                    output_lines.append("Player Highlights")
-                    output_lines.append("Challenge\tPlayer\tPoints")
+                    yield "Player Highlights"
+                    yield _WEEKLY_PLAYER_HEADER
 
                     for challenge in player_challenges:
                         # Include position in player display
-                        position = challenge.additional_info.get("position", "")
+                        position = challenge.position
                         winner_display = f"{challenge.winner} ({position})"
 
-                        output_lines.append(
-                            f"{challenge.challenge_name}\t{winner_display}\t{challenge.value}"
-                        )
+                        yield f"{challenge.challenge_name}\t{winner_display}\t{challenge.value}"
 
-                    output_lines.append("")
+                    yield ""
 
-                output_lines.append("")
+                yield ""
 
         # Season challenges with historical note in playoff mode
         if challenges:
             if is_playoff_mode:
-                output_lines.append(
-                    "OVERALL SEASON CHALLENGES (Regular season - finalized at end of week 14)"
-                )
+                yield "OVERALL SEASON CHALLENGES (Regular season - finalized at end of week 14)"
             else:
-                output_lines.append("OVERALL SEASON CHALLENGES")
-            output_lines.append("Challenge\tWinner\tOwner\tDivision\tDetails")
+                yield "OVERALL SEASON CHALLENGES"
+            yield _CHALLENGE_HEADER
 
             for challenge in challenges:
-                output_lines.append(
+                yield (
                     f"{challenge.challenge_name}\t{challenge.winner}\t{challenge.owner.full_name}\t"
                     f"{challenge.division}\t{challenge.description}"
                 )
 
-            output_lines.append("")
+            yield ""
 
             total_games = self._calculate_total_games(divisions)
             if total_games > 0:
-                output_lines.append(f"Game data: {total_games} individual results processed")
+                yield f"Game data: {total_games} individual results processed"
             else:
-                output_lines.append("Game data: Limited - some challenges may be incomplete")
+                yield "Game data: Limited - some challenges may be incomplete"
 
-            output_lines.append("")
+            yield ""
 
         # Final standings (last in playoff mode, labeled as historical)
         if is_playoff_mode:
-            output_lines.append("FINAL REGULAR SEASON STANDINGS (Week 14)")
+            yield "FINAL REGULAR SEASON STANDINGS (Week 14)"
         else:
-            output_lines.append("DIVISION STANDINGS")
-        output_lines.append("")
+            yield "DIVISION STANDINGS"
+        yield ""
 
         # Division standings
         for division in divisions:
-            output_lines.append(f"{division.name} STANDINGS")
-            output_lines.append("Rank\tTeam\tOwner\tPoints For\tPoints Against\tRecord\tPlayoffs")
+            yield f"{division.name} STANDINGS"
+            yield _DIVISION_HEADER
 
             sorted_teams = self._get_sorted_teams_by_division(division)
             for i, team in enumerate(sorted_teams, 1):
                 playoff_indicator = "Y" if team.in_playoff_position else "N"
-                output_lines.append(
+                yield (
                     f"{i}\t{team.name}\t{team.owner.full_name}\t{team.points_for:.1f}\t"
-                    f"{team.points_against:.1f}\t{team.wins}-{team.losses}\t{playoff_indicator}"
+                    f"{team.points_against:.1f}\t{team.record}\t{playoff_indicator}"
                 )
 
-            output_lines.append("")
+            yield ""
 
         # Overall top teams
         if is_playoff_mode:
-            output_lines.append("OVERALL TOP TEAMS (Final Regular Season - Week 14)")
+            yield "OVERALL TOP TEAMS (Final Regular Season - Week 14)"
         else:
-            output_lines.append("OVERALL TOP TEAMS (Across All Divisions)")
-        output_lines.append(
-            "Rank\tTeam\tOwner\tDivision\tPoints For\tPoints Against\tRecord\tPlayoffs"
-        )
+            yield "OVERALL TOP TEAMS (Across All Divisions)"
+        yield _OVERALL_HEADER
 
         top_teams = self._get_overall_top_teams(divisions, limit=20)
         for i, team in enumerate(top_teams, 1):
             playoff_indicator = "Y" if team.in_playoff_position else "N"
-            output_lines.append(
+            yield (
                 f"{i}\t{team.name}\t{team.owner.full_name}\t{team.division}\t{team.points_for:.1f}\t"
-                f"{team.points_against:.1f}\t{team.wins}-{team.losses}\t{playoff_indicator}"
+                f"{team.points_against:.1f}\t{team.record}\t{playoff_indicator}"
             )
 
-        return "\n".join(output_lines)
-
     def _format_playoff_brackets(self, divisions: Sequence[DivisionData]) -> list[str]:
         """Format playoff bracket matchups as TSV lines."""
         lines: list[str] = []
@@ -219,6 +266,8 @@ class SheetsFormatter(BaseFormatter):
             else "Unknown"
         )
 
+        is_semifinals = bracket_round == "Semifinals"
+
         lines.append(f"PLAYOFF BRACKET - {bracket_round.upper()}")
         lines.append("")
 
@@ -227,14 +276,14 @@ class SheetsFormatter(BaseFormatter):
                 continue
 
             lines.append(f"{div.name} - {bracket_round}")
-            lines.append("Matchup\tSeed\tTeam\tOwner\tScore\tResult")
+            lines.append(_PLAYOFF_BRACKET_HEADER)
 
             for i, matchup in enumerate(div.playoff_bracket.matchups, 1):
-                matchup_label = f"Semifinal {i}" if bracket_round == "Semifinals" else "Finals"
+                matchup_label = f"Semifinal {i}" if is_semifinals else "Finals"
 
                 # Team 1
                 result1 = "WINNER" if matchup.winner_seed == matchup.seed1 else "---"
-                score1_display = f"{matchup.score1:.2f}" if matchup.score1 is not None else "TBD"
+                score1_display = matchup.score1_display
                 lines.append(
                     f"{matchup_label}\t{matchup.seed1}\t{matchup.team1_name}\t"
                     f"{matchup.owner1_name}\t{score1_display}\t{result1}"
@@ -242,7 +291,7 @@ class SheetsFormatter(BaseFormatter):
 
                 # Team 2
                 result2 = "WINNER" if matchup.winner_seed == matchup.seed2 else "---"
-                score2_display = f"{matchup.score2:.2f}" if matchup.score2 is not None else "TBD"
+                score2_display = matchup.score2_display
                 lines.append(
                     f"{matchup_label}\t{matchup.seed2}\t{matchup.team2_name}\t"
                     f"{matchup.owner2_name}\t{score2_display}\t{result2}"
@@ -256,23 +305,15 @@ class SheetsFormatter(BaseFormatter):
         self, championship: ChampionshipLeaderboard, rosters: Sequence | None = None
     ) -> list[str]:
         """Format championship leaderboard as TSV lines."""
-        lines: list[str] = []
-
-        lines.append("CHAMPIONSHIP WEEK - FINAL LEADERBOARD")
-        lines.append("Highest score wins overall championship")
-        lines.append("")
-
-        lines.append("Rank\tMedal\tTeam\tOwner\tDivision\tScore")
+        lines = [
+            "CHAMPIONSHIP WEEK - FINAL LEADERBOARD",
+            "Highest score wins overall championship",
+            "",
+            _CHAMPIONSHIP_HEADER,
+        ]
 
         for entry in championship.entries:
-            medal = ""
-            if entry.rank == 1:
-                medal = "🥇"
-            elif entry.rank == 2:
-                medal = "🥈"
-            elif entry.rank == 3:
-                medal = "🥉"
-
+            medal = _RANK_MEDALS.get(entry.rank, "")
             lines.append(
                 f"{entry.rank}\t{medal}\t{entry.team_name}\t{entry.owner_name}\t"
                 f"{entry.division_name}\t{entry.score:.2f}"
@@ -300,34 +341,32 @@ class SheetsFormatter(BaseFormatter):
 
     def _format_championship_rosters(self, rosters: Sequence) -> list[str]:
         """Format championship rosters as TSV."""
-        lines: list[str] = []
-
-        lines.append("DETAILED ROSTERS")
-        lines.append("")
+        lines = ["DETAILED ROSTERS", ""]
+        append = lines.append
 
         for roster in rosters:
-            lines.append(
-                f"{roster.team.team_name} ({roster.team.owner_name}) - {roster.team.division_name}"
-            )
-            lines.append(
-                f"Score: {roster.total_score:.2f} pts | Projected: {roster.projected_score:.2f} pts"
+            team = roster.team
+            lines.extend(
+                (
+                    f"{team.team_name} ({team.owner_name}) - {team.division_name}",
+                    f"Score: {roster.total_score:.2f} pts | Projected: {roster.projected_score:.2f} pts",
+                    "",
+                    # Starters table
+                    "STARTERS",
+                    _ROSTER_STARTERS_HEADER,
+                )
             )
-            lines.append("")
-
-            # Starters table
-            lines.append("STARTERS")
-            lines.append("Status\tPos\tPlayer\tTeam\tPoints")
 
             for slot in roster.starters:
                 status_icon = "✅" if slot.game_status == "final" else "⏳"
                 player_display = slot.player_name or "EMPTY"
                 team_display = slot.player_team or ""
 
-                lines.append(
+                append(
                     f"{status_icon}\t{slot.position}\t{player_display}\t{team_display}\t{slot.actual_points:.2f}"
                 )
 
-            lines.append("")
+            append("")
 
         return lines
 
@@ -335,14 +374,11 @@ class SheetsFormatter(BaseFormatter):
         self, player_challenges: Sequence[WeeklyChallenge], current_week: int
     ) -> list[str]:
         """Format weekly player highlights table."""
-        lines: list[str] = []
-
-        lines.append(f"WEEK {current_week} PLAYER HIGHLIGHTS")
-        lines.append("Challenge\tPlayer\tPoints")
+        lines = [f"WEEK {current_week} PLAYER HIGHLIGHTS", _WEEKLY_PLAYER_HEADER]
 
         for challenge in player_challenges:
             # Include position in player display
-            position = challenge.additional_info.get("position", "")
+            position = challenge.position
             winner_display = f"{challenge.winner} ({position})"
 
             lines.append(f"{challenge.challenge_name}\t{winner_display}\t{challenge.value}")
@@ -17,7 +17,9 @@ from __future__ import annotations
 import argparse
 import logging
 import sys
+from itertools import chain
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from .cli_utils import (
     get_formatter_args,
@@ -27,8 +29,11 @@ from .cli_utils import (
 )
 from .display import create_formatter
 from .exceptions import FFTrackerError
-from .models import WeeklyChallenge, WeeklyGameResult, WeeklyPlayerStats
-from .services import ChallengeCalculator, ESPNService, WeeklyChallengeCalculator
+
+# Models are only needed for annotations; services are imported inside main()
+# so --help and argument errors never load the ESPN service stack
+if TYPE_CHECKING:
+    from .models import WeeklyChallenge, WeeklyGameResult, WeeklyPlayerStats
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -210,8 +215,9 @@ def main() -> int:
             print(f"Error parsing format arguments: {e}", file=sys.stderr)
             return 1
 
-        # Load configuration
+        # Load configuration and services only once arguments are valid
         from .config import create_config
+        from .services import ChallengeCalculator, ESPNService, WeeklyChallengeCalculator
 
         if args.env:
             # Load multiple leagues from environment
@@ -242,7 +248,7 @@ def main() -> int:
         championship = None
         if divisions and divisions[0].is_playoff_mode:
             # We're in playoffs - check if Championship Week
-            # Reconnect to first league to check playoff round
+            # First league is already connected by load_all_divisions (cached)
             test_league = espn_service.connect_to_league(config.league_ids[0])
             try:
                 playoff_round = espn_service.get_playoff_round(test_league)
@@ -261,12 +267,15 @@ def main() -> int:
         # Calculate weekly challenges if we have weekly data
         weekly_challenges: list[WeeklyChallenge] = []
         if espn_service.current_week and espn_service.current_week > 0:
-            # Combine all weekly games and players from all divisions
-            all_weekly_games: list[WeeklyGameResult] = []
-            all_weekly_players: list[WeeklyPlayerStats] = []
-            for division in divisions:
-                all_weekly_games.extend(division.weekly_games)
-                all_weekly_players.extend(division.weekly_players)
+            # Combine all weekly games and players from all divisions. The
+            # calculator takes sequences (len() and several passes), so these
+            # stay lists.
+            all_weekly_games: list[WeeklyGameResult] = list(
+                chain.from_iterable(division.weekly_games for division in divisions)
+            )
+            all_weekly_players: list[WeeklyPlayerStats] = list(
+                chain.from_iterable(division.weekly_players for division in divisions)
+            )
 
             # Calculate weekly challenges if we have data
             if all_weekly_games or all_weekly_players:
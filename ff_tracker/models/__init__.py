@@ -35,7 +35,7 @@ from .season_summary import (
 )
 from .team import TeamStats
 from .week import WeeklyGameResult
-from .weekly_challenge import WeeklyChallenge
+from .weekly_challenge import WeeklyChallenge, split_weekly_challenges
 
 __all__ = [
     "Validatable",
@@ -51,6 +51,7 @@ __all__ = [
     "WeeklyGameResult",
     "WeeklyPlayerStats",
     "WeeklyChallenge",
+    "split_weekly_challenges",
     "PlayoffMatchup",
     "PlayoffBracket",
     "ChampionshipEntry",
@@ -5,6 +5,8 @@ Division data model representing a complete league.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import cached_property
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
 from ..exceptions import DataValidationError
@@ -16,6 +18,9 @@ from .week import WeeklyGameResult
 if TYPE_CHECKING:
     from .playoff import PlayoffBracket
 
+# Standings sort key: wins, then points for
+_STANDINGS_KEY = attrgetter("wins", "points_for")
+
 
 def _empty_weekly_games() -> list[WeeklyGameResult]:
     """Factory for empty weekly games list."""
@@ -74,6 +79,16 @@ class DivisionData:
                     f"Game has division '{game.division}' but should be '{self.name}'"
                 )
 
+    @cached_property
+    def slug(self) -> str:
+        """URL-friendly anchor slug derived from the division name."""
+        return self.name.lower().replace(" ", "-")
+
+    @cached_property
+    def sorted_teams(self) -> tuple[TeamStats, ...]:
+        """Teams in standings order: wins, then points for (both descending)."""
+        return tuple(sorted(self.teams, key=_STANDINGS_KEY, reverse=True))
+
     @property
     def team_count(self) -> int:
         """Number of teams in this division."""
@@ -5,6 +5,7 @@ Owner data model for ESPN team owners.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 
 from ..exceptions import DataValidationError
 
@@ -39,7 +40,7 @@ class Owner:
         ]):
             raise DataValidationError("Owner must have at least one name field")
 
-    @property
+    @cached_property
     def full_name(self) -> str:
         """Get the owner's full name, preferring real name over display name."""
         if self.first_name.strip() and self.last_name.strip():
@@ -9,6 +9,7 @@ and frozen dataclasses for immutability.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 
 from ..exceptions import DataValidationError
 
@@ -94,6 +95,16 @@ class PlayoffMatchup:
         if not self.division_name.strip():
             raise DataValidationError("division_name cannot be empty")
 
+    @cached_property
+    def score1_display(self) -> str:
+        """First team's score to two decimals, or "TBD" before the game starts."""
+        return f"{self.score1:.2f}" if self.score1 is not None else "TBD"
+
+    @cached_property
+    def score2_display(self) -> str:
+        """Second team's score to two decimals, or "TBD" before the game starts."""
+        return f"{self.score2:.2f}" if self.score2 is not None else "TBD"
+
 
 @dataclass(frozen=True)
 class PlayoffBracket:
@@ -9,6 +9,7 @@ and complete season summaries.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from ..exceptions import DataValidationError
@@ -118,7 +119,7 @@ class DivisionChampion:
         if self.final_rank < 1:
             raise DataValidationError(f"Final rank must be at least 1, got {self.final_rank}")
 
-    @property
+    @cached_property
     def record(self) -> str:
         """Get formatted record string (e.g., '10-4')."""
         return f"{self.wins}-{self.losses}"
@@ -5,6 +5,7 @@ Team statistics data model for season-long performance.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 
 from ..exceptions import DataValidationError
 from .owner import Owner
@@ -63,3 +64,8 @@ class TeamStats:
         if self.total_games == 0:
             return 0.0
         return self.wins / self.total_games
+
+    @cached_property
+    def record(self) -> str:
+        """Get formatted record string (e.g., '10-4')."""
+        return f"{self.wins}-{self.losses}"
@@ -4,7 +4,9 @@ Weekly challenge result data model for week-specific challenges.
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Any
 
 from ..exceptions import DataValidationError
@@ -61,3 +63,38 @@ class WeeklyChallenge:
     def is_team_challenge(self) -> bool:
         """Check if this is a team-based challenge."""
         return not self.is_player_challenge
+
+    @cached_property
+    def is_player_highlight(self) -> bool:
+        """Check if this challenge records a player position (shown as a player highlight)."""
+        return "position" in self.additional_info
+
+    @cached_property
+    def position(self) -> str:
+        """Get the player position for player highlights (empty for team challenges)."""
+        return str(self.additional_info.get("position", ""))
+
+
+def split_weekly_challenges(
+    challenges: Iterable[WeeklyChallenge],
+) -> tuple[list[WeeklyChallenge], list[WeeklyChallenge]]:
+    """
+    Split weekly challenges into team and player challenges in a single pass.
+
+    A challenge counts as a player challenge when is_player_highlight is set,
+    which is how the weekly formatters separate them.
+
+    Args:
+        challenges: Weekly challenge results to split
+
+    Returns:
+        Tuple of (team_challenges, player_challenges), each in input order
+    """
+    team_challenges: list[WeeklyChallenge] = []
+    player_challenges: list[WeeklyChallenge] = []
+    for challenge in challenges:
+        if challenge.is_player_highlight:
+            player_challenges.append(challenge)
+        else:
+            team_challenges.append(challenge)
+    return team_challenges, player_challenges
@@ -38,11 +38,16 @@ class ESPNService:
         """
         self.config = config
         self.current_week: int | None = None
+        # Connected leagues by ID, reused for the rest of the run
+        self._leagues: dict[int, League] = {}
 
     def connect_to_league(self, league_id: int) -> League:
         """
         Connect to a specific ESPN league.
 
+        Each league is fetched from ESPN once per service instance; later calls
+        for the same ID return the already connected League.
+
         Args:
             league_id: ESPN league ID to connect to
 
@@ -53,6 +58,10 @@ class ESPNService:
             LeagueConnectionError: If connection fails
             PrivateLeagueError: If private league credentials are invalid
         """
+        cached = self._leagues.get(league_id)
+        if cached is not None:
+            return cached
+
         try:
             from espn_api.football import League
 
@@ -74,6 +83,7 @@ class ESPNService:
                 league = League(league_id=league_id, year=self.config.year)
 
             logger.debug(f"Successfully connected to league {league_id}")
+            self._leagues[league_id] = league
             return league
 
         except Exception as e:
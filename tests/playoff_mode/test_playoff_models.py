@@ -65,6 +65,29 @@ def test_playoff_matchup():
     assert in_progress.winner_name is None
     print("  ✓ Valid in-progress matchup created")
 
+    # Score display strings
+    not_started = PlayoffMatchup(
+        matchup_id="div3_finals",
+        round_name="Finals",
+        seed1=1,
+        team1_name="Gridiron Gang",
+        owner1_name="Pat",
+        score1=None,
+        seed2=2,
+        team2_name="End Zone Elite",
+        owner2_name="Sam",
+        score2=None,
+        winner_name=None,
+        winner_seed=None,
+        division_name="Division 3",
+    )
+    assert matchup.score1_display == "145.67"
+    assert matchup.score2_display == "98.23"
+    assert in_progress.score1_display == "0.00"
+    assert not_started.score1_display == "TBD"
+    assert not_started.score2_display == "TBD"
+    print("  ✓ Score display strings work")
+
     # Test validation - invalid seed
     with pytest.raises(DataValidationError, match=r"Seeds must be positive"):
         PlayoffMatchup(
@@ -602,6 +602,10 @@ class TestConsoleFormatterArgHelpers:
         assert sorted_teams[1].name == "High Wins Low Points"  # 10 wins, 1000 points
         assert sorted_teams[2].name == "Low Wins"  # 5 wins
 
+        # Mutating the returned list must not reorder the division's cached standings
+        sorted_teams.reverse()
+        assert formatter._get_sorted_teams_by_division(division)[0].name == "High Wins High Points"
+
     def test_get_overall_top_teams(self) -> None:
         """Test _get_overall_top_teams combines and limits teams correctly."""
         owner1 = Owner(display_name="Alice", first_name="Alice", last_name="Smith", id="alice123")
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from importlib.metadata import PackageNotFoundError
+
 import pytest
 
+from ff_tracker.display import base
 from ff_tracker.display.email import EmailFormatter
 from ff_tracker.models import (
     ChallengeResult,
@@ -19,6 +23,19 @@ from ff_tracker.models import (
 )
 
 
+@pytest.fixture
+def missing_package_metadata(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Simulate running from a source checkout with no installed package metadata."""
+
+    def raise_not_found(name: str) -> str:
+        raise PackageNotFoundError(name)
+
+    monkeypatch.setattr(base, "version", raise_not_found)
+    base._package_version.cache_clear()
+    yield
+    base._package_version.cache_clear()
+
+
 @pytest.fixture
 def sample_owner_alice() -> Owner:
     """Create a sample owner Alice."""
@@ -316,6 +333,21 @@ class TestFormatOutput:
         assert "Most Points Overall" in output
         assert "<!DOCTYPE html>" in output
 
+    @pytest.mark.usefixtures("missing_package_metadata")
+    def test_format_output_without_package_metadata(
+        self,
+        sample_division: DivisionData,
+        sample_challenges: list[ChallengeResult],
+    ) -> None:
+        """Test the footer falls back to an unknown version instead of crashing."""
+        formatter = EmailFormatter(year=2024)
+        output = formatter.format_output(
+            divisions=[sample_division],
+            challenges=sample_challenges,
+        )
+
+        assert "Fantasy Football Challenge Tracker</strong> vunknown" in output
+
 
 class TestHTMLStructure:
     """Tests for HTML structure and formatting."""
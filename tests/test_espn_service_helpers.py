@@ -11,7 +11,7 @@ Tests focus on methods that can be tested without ESPN API connection:
 
 from __future__ import annotations
 
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -763,6 +763,20 @@ class TestConnectToLeagueErrorHandling:
         with pytest.raises(LeagueConnectionError, match="Failed to connect to league"):
             service.connect_to_league(123456)
 
+    def test_connect_to_league_reuses_connection(self) -> None:
+        """Test that each league is only fetched from ESPN once per service."""
+        config = FFTrackerConfig(league_ids=[123456, 789012], year=2024, private=False)
+        service = ESPNService(config)
+
+        with patch("espn_api.football.League", side_effect=lambda **kw: Mock(**kw)) as league_cls:
+            first = service.connect_to_league(123456)
+            again = service.connect_to_league(123456)
+            other = service.connect_to_league(789012)
+
+        assert first is again
+        assert other is not first
+        assert league_cls.call_count == 2
+
 
 class TestCreateWeeklyPlayerStat:
     """Tests for _create_weekly_player_stat helper method."""
@@ -12,6 +12,7 @@ from ff_tracker.models import (
     Owner,
     TeamStats,
     WeeklyChallenge,
+    split_weekly_challenges,
 )
 
 
@@ -355,7 +356,7 @@ class TestTableFormatting:
     ) -> None:
         """Test challenge table formatting."""
         formatter = MarkdownFormatter(year=2024)
-        output = formatter._format_challenge_table(sample_challenges)
+        output = "\n".join(formatter._challenge_table_lines(sample_challenges))
 
         # All challenges should be present
         assert "Most Points Overall" in output
@@ -370,7 +371,9 @@ class TestTableFormatting:
     ) -> None:
         """Test weekly challenge table formatting."""
         formatter = MarkdownFormatter(year=2024)
-        output = formatter._format_weekly_table(sample_weekly_challenges)
+        output = "\n".join(
+            formatter._weekly_table_lines(*split_weekly_challenges(sample_weekly_challenges))
+        )
 
         # All weekly challenges should be present
         assert "Highest Score This Week" in output
@@ -389,7 +392,7 @@ class TestTableFormatting:
         player_challenges = [c for c in sample_weekly_challenges if "position" in c.additional_info]
 
         formatter = MarkdownFormatter(year=2024)
-        output = formatter._format_weekly_player_table(player_challenges)
+        output = "\n".join(formatter._weekly_player_table_lines(player_challenges))
 
         # Player challenges should be present
         assert "Patrick Mahomes" in output
@@ -401,7 +404,7 @@ class TestTableFormatting:
     ) -> None:
         """Test division table formatting."""
         formatter = MarkdownFormatter(year=2024)
-        output = formatter._format_division_table(sample_division)
+        output = "\n".join(formatter._division_table_lines(sample_division))
 
         # Teams should be present
         assert "Alice's Team" in output
@@ -414,7 +417,7 @@ class TestTableFormatting:
     ) -> None:
         """Test overall table formatting."""
         formatter = MarkdownFormatter(year=2024)
-        output = formatter._format_overall_table([sample_division])
+        output = "\n".join(formatter._overall_table_lines([sample_division]))
 
         # Teams should be present
         assert "Alice's Team" in output
@@ -453,20 +456,20 @@ class TestEdgeCases:
         assert "Alice" in output
 
     def test_format_challenge_table_empty(self) -> None:
-        """Test format_challenge_table with empty list."""
+        """Test challenge table lines with empty list."""
         formatter = MarkdownFormatter(year=2024)
-        output = formatter._format_challenge_table([])
+        lines = formatter._challenge_table_lines([])
 
-        # Should return empty string or minimal output
-        assert isinstance(output, str)
+        # Should return a (possibly empty) list of lines
+        assert isinstance(lines, list)
 
     def test_format_weekly_table_empty(self) -> None:
-        """Test format_weekly_table with empty list."""
+        """Test weekly table lines with empty list."""
         formatter = MarkdownFormatter(year=2024)
-        output = formatter._format_weekly_table([])
+        lines = formatter._weekly_table_lines([], [])
 
-        # Should return empty string or minimal output
-        assert isinstance(output, str)
+        # Should return a (possibly empty) list of lines
+        assert isinstance(lines, list)
 
     def test_format_output_with_all_format_args(
         self,
@@ -598,7 +601,7 @@ class TestMultipleDivisions:
         )
 
         formatter = MarkdownFormatter(year=2024)
-        output = formatter._format_overall_table([div1, div2])
+        output = "\n".join(formatter._overall_table_lines([div1, div2]))
 
         # Should combine teams from both divisions
         assert "Alice's Team" in output
@@ -12,6 +12,7 @@ import pytest
 from ff_tracker.exceptions import DataValidationError
 from ff_tracker.models import (
     ChallengeResult,
+    DivisionChampion,
     DivisionData,
     GameResult,
     Owner,
@@ -19,6 +20,7 @@ from ff_tracker.models import (
     WeeklyChallenge,
     WeeklyGameResult,
     WeeklyPlayerStats,
+    split_weekly_challenges,
 )
 
 # ============================================================================
@@ -54,6 +56,11 @@ class TestOwnerProperties:
         owner = Owner(display_name="alice123", first_name="  ", last_name="  ", id="alice123")
         assert owner.full_name == "alice123"
 
+    def test_full_name_is_cached(self) -> None:
+        """Test full_name is computed once and reused on later accesses."""
+        owner = Owner(display_name="alice123", first_name="Alice", last_name="Smith", id="alice123")
+        assert owner.full_name is owner.full_name
+
     def test_is_likely_username_for_espnfan_prefix(self) -> None:
         """Test username detection for ESPNFAN prefix."""
         owner = Owner(display_name="ESPNFAN12345", first_name="", last_name="", id="espn123")
@@ -158,6 +165,21 @@ class TestTeamStatsProperties:
         )
         assert team.total_games == 0
 
+    def test_record_is_formatted_and_cached(self) -> None:
+        """Test record formats wins-losses and is reused on later accesses."""
+        owner = Owner(display_name="Alice", first_name="Alice", last_name="Smith", id="alice123")
+        team = TeamStats(
+            name="Alice's Team",
+            owner=owner,
+            points_for=1200.0,
+            points_against=1000.0,
+            wins=8,
+            losses=3,
+            division="League A",
+        )
+        assert team.record == "8-3"
+        assert team.record is team.record
+
     def test_win_percentage_calculation(self) -> None:
         """Test win_percentage property calculation."""
         owner = Owner(display_name="Alice", first_name="Alice", last_name="Smith", id="alice123")
@@ -1198,6 +1220,63 @@ class TestWeeklyChallengeProperties:
         )
         assert challenge.is_team_challenge is False
 
+    def test_is_player_highlight_requires_position(self) -> None:
+        """Test is_player_highlight only checks for a recorded position."""
+        owner = Owner(display_name="Alice", first_name="Alice", last_name="Smith", id="alice123")
+        named_player = WeeklyChallenge(
+            challenge_name="Top Scoring Player",
+            week=5,
+            winner="Patrick Mahomes",
+            owner=owner,
+            division="League A",
+            value="28.5",
+            description="Patrick Mahomes scored 28.5 points",
+            additional_info={"team": "Alice's Team"},
+        )
+        positioned = WeeklyChallenge(
+            challenge_name="Best RB",
+            week=5,
+            winner="Christian McCaffrey",
+            owner=owner,
+            division="League A",
+            value="32.0",
+            description="Christian McCaffrey scored 32.0 points",
+            additional_info={"position": "RB"},
+        )
+        assert named_player.is_player_highlight is False
+        assert positioned.is_player_highlight is True
+
+        # Position is read once and cached alongside the highlight flag
+        assert named_player.position == ""
+        assert positioned.position == "RB"
+        assert positioned.position is positioned.position
+
+    def test_split_weekly_challenges_preserves_order(self) -> None:
+        """Test split_weekly_challenges separates team and player challenges in order."""
+        owner = Owner(display_name="Alice", first_name="Alice", last_name="Smith", id="alice123")
+
+        def make(name: str, additional_info: dict[str, str]) -> WeeklyChallenge:
+            return WeeklyChallenge(
+                challenge_name=name,
+                week=5,
+                winner="Alice's Team",
+                owner=owner,
+                division="League A",
+                value="10.0",
+                description=f"{name} description",
+                additional_info=additional_info,
+            )
+
+        high = make("Highest Score This Week", {})
+        qb = make("Best QB", {"position": "QB"})
+        win = make("Biggest Win This Week", {"margin": "50.0"})
+        rb = make("Best RB", {"position": "RB"})
+
+        team_challenges, player_challenges = split_weekly_challenges([high, qb, win, rb])
+
+        assert team_challenges == [high, win]
+        assert player_challenges == [qb, rb]
+
 
 class TestWeeklyChallengeValidation:
     """Test WeeklyChallenge validation logic."""
@@ -1445,6 +1524,52 @@ class TestDivisionDataProperties:
         )
         assert division.is_playoff_mode is False
 
+    def test_slug_property(self) -> None:
+        """Test slug lowercases the name and replaces spaces with hyphens."""
+        owner = Owner(display_name="Alice", first_name="Alice", last_name="Smith", id="alice123")
+        teams = [
+            TeamStats(
+                name="Team A",
+                owner=owner,
+                points_for=1200.0,
+                points_against=900.0,
+                wins=10,
+                losses=3,
+                division="Big Ten League",
+            ),
+        ]
+        division = DivisionData(
+            league_id=123456,
+            name="Big Ten League",
+            teams=teams,
+            games=[],
+        )
+        assert division.slug == "big-ten-league"
+
+    def test_sorted_teams_property(self) -> None:
+        """Test sorted_teams orders by wins then points for and is cached."""
+        owner = Owner(display_name="Alice", first_name="Alice", last_name="Smith", id="alice123")
+        teams = [
+            TeamStats(
+                name=name,
+                owner=owner,
+                points_for=points_for,
+                points_against=900.0,
+                wins=wins,
+                losses=13 - wins,
+                division="League A",
+            )
+            for name, wins, points_for in [
+                ("Team A", 8, 1100.0),
+                ("Team B", 10, 1000.0),
+                ("Team C", 8, 1200.0),
+            ]
+        ]
+        division = DivisionData(league_id=123456, name="League A", teams=teams, games=[])
+        assert [team.name for team in division.sorted_teams] == ["Team B", "Team C", "Team A"]
+        assert isinstance(division.sorted_teams, tuple)
+        assert division.sorted_teams is division.sorted_teams
+
     def test_get_team_by_name_found(self) -> None:
         """Test get_team_by_name returns correct team."""
         owner = Owner(display_name="Alice", first_name="Alice", last_name="Smith", id="alice123")
@@ -1639,3 +1764,27 @@ class TestDivisionDataValidation:
                 weekly_players=[],
                 playoff_bracket=None,
             )
+
+
+# ============================================================================
+# DivisionChampion Model Tests
+# ============================================================================
+
+
+class TestDivisionChampionProperties:
+    """Test DivisionChampion computed properties."""
+
+    def test_record_is_formatted_and_cached(self) -> None:
+        """Test record formats wins-losses and is reused on later accesses."""
+        champion = DivisionChampion(
+            division_name="League A",
+            team_name="Team A",
+            owner_name="Alice Smith",
+            wins=10,
+            losses=4,
+            points_for=1500.0,
+            points_against=1200.0,
+            final_rank=1,
+        )
+        assert champion.record == "10-4"
+        assert champion.record is champion.record
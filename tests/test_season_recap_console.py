@@ -0,0 +1,88 @@
+"""Tests for season recap console table rendering."""
+
+from __future__ import annotations
+
+import pytest
+from tabulate import tabulate
+
+from ff_tracker.display.season_recap_console import SeasonRecapConsoleFormatter, _render_table
+from ff_tracker.models import ChallengeResult, Owner
+
+
+class TestRenderTable:
+    """Golden-output tests for the season recap table renderer."""
+
+    def test_grid_layout(self) -> None:
+        """Test grid tables right-align numeric columns and size wide emoji correctly."""
+        output = _render_table(
+            ["Rank", "Team", "Score"],
+            [["🏆 1", "Alpha", "150.25"], ["2", "Beta Team", "99.50"]],
+        )
+
+        assert output == "\n".join(
+            [
+                "+--------+-----------+---------+",
+                "| Rank   | Team      |   Score |",
+                "+========+===========+=========+",
+                "| 🏆 1   | Alpha     |  150.25 |",
+                "+--------+-----------+---------+",
+                "| 2      | Beta Team |   99.50 |",
+                "+--------+-----------+---------+",
+            ]
+        )
+
+    def test_simple_layout(self) -> None:
+        """Test simple tables underline headers and right-align numeric columns."""
+        output = _render_table(
+            ["Rank", "Team", "Record", "PF"],
+            [["1", "Alpha", "10-4", "1500.50"], ["10", "Beta", "4-10", "999.25"]],
+            grid=False,
+        )
+
+        assert output == "\n".join(
+            [
+                "  Rank  Team    Record         PF",
+                "------  ------  --------  -------",
+                "     1  Alpha   10-4      1500.50",
+                "    10  Beta    4-10       999.25",
+            ]
+        )
+
+    @pytest.mark.parametrize(("grid", "tablefmt"), [(True, "grid"), (False, "simple")])
+    @pytest.mark.parametrize(
+        ("headers", "rows"),
+        [
+            (["A", "B"], []),
+            (
+                ["Challenge", "Value"],
+                [["Most Wins", "12 wins"], ["Worst Record", "3-11"], ["Escape", "<b>"]],
+            ),
+            (["Division", "Value"], [["Div 1", "152.5"], ["Div 2", "12.5"]]),
+            (["Team", "Owner"], [["Tëam 🏈", "Al"], ["B", "Christopher"]]),
+        ],
+    )
+    def test_matches_tabulate(
+        self, headers: list[str], rows: list[list[str]], grid: bool, tablefmt: str
+    ) -> None:
+        """Test output matches tabulate for cells tabulate prints unchanged."""
+        assert _render_table(headers, rows, grid=grid) == tabulate(
+            rows, headers=headers, tablefmt=tablefmt
+        )
+
+
+class TestSeasonChallengesTable:
+    """Tests for the season challenges table."""
+
+    def test_free_text_values_are_left_aligned(self) -> None:
+        """Test non-numeric challenge values keep tabulate's left alignment."""
+        owner = Owner(display_name="Alice", first_name="Alice", last_name="Smith", id="alice123")
+        challenges = [
+            ChallengeResult("Most Wins", "Alpha", owner, "Div 1", "12 wins", "12 wins"),
+            ChallengeResult("Worst Record", "Beta", owner, "Div 2", "3-11", "3-11 record"),
+        ]
+
+        output = SeasonRecapConsoleFormatter(2024)._format_season_challenges(challenges)
+
+        assert "| Value   |" in output
+        assert "| 12 wins |" in output
+        assert "| 3-11    |" in output
@@ -0,0 +1,233 @@
+"""Tests for season recap email and JSON formatters."""
+
+from __future__ import annotations
+
+import io
+from collections.abc import Iterator
+from importlib.metadata import PackageNotFoundError
+
+import pytest
+
+from ff_tracker.display import base
+from ff_tracker.display.json import JsonFormatter
+from ff_tracker.display.season_recap_email import SeasonRecapEmailFormatter
+from ff_tracker.display.season_recap_json import SeasonRecapJsonFormatter
+from ff_tracker.models import (
+    ChallengeResult,
+    DivisionChampion,
+    DivisionData,
+    Owner,
+    PlayoffBracket,
+    PlayoffMatchup,
+    PlayoffRound,
+    PlayoffSummary,
+    RegularSeasonSummary,
+    SeasonStructure,
+    SeasonSummary,
+    TeamStats,
+)
+
+CHALLENGE_NAMES = (
+    "Most Points Overall",
+    "Most Points in One Game",
+    "Most Points in a Loss",
+    "Least Points in a Win",
+    "Closest Victory",
+)
+
+
+@pytest.fixture
+def special_owner() -> Owner:
+    """Create an owner whose name contains HTML special characters."""
+    return Owner(display_name="alice", first_name="Alice & Bob", last_name="<Smith>", id="a1")
+
+
+@pytest.fixture
+def structure() -> SeasonStructure:
+    """Create a standard 14-week season with two playoff rounds."""
+    return SeasonStructure(
+        regular_season_start=1,
+        regular_season_end=14,
+        playoff_start=15,
+        playoff_end=16,
+        championship_week=17,
+        playoff_rounds=2,
+        playoff_round_length=1,
+    )
+
+
+def _make_summary(
+    structure: SeasonStructure, owner: Owner, team_name: str, challenge_value: str
+) -> SeasonSummary:
+    """Build a one-division season summary around a single champion team."""
+    other_owner = Owner(display_name="carol", first_name="Carol", last_name="Jones", id="c1")
+    champion_team = TeamStats(
+        name=team_name,
+        owner=owner,
+        points_for=1500.5,
+        points_against=1200.25,
+        wins=10,
+        losses=4,
+        division="Div A",
+        in_playoff_position=True,
+    )
+    other_team = TeamStats(
+        name="Plain Team",
+        owner=other_owner,
+        points_for=1300.0,
+        points_against=1250.0,
+        wins=7,
+        losses=7,
+        division="Div A",
+    )
+    division = DivisionData(league_id=1, name="Div A", teams=[champion_team, other_team], games=[])
+    champion = DivisionChampion(
+        division_name="Div A",
+        team_name=team_name,
+        owner_name=owner.full_name,
+        wins=10,
+        losses=4,
+        points_for=1500.5,
+        points_against=1200.25,
+        final_rank=1,
+    )
+    final = PlayoffMatchup(
+        "f1",
+        "Finals",
+        1,
+        team_name,
+        owner.full_name,
+        120.5,
+        2,
+        "Plain Team",
+        other_owner.full_name,
+        99.0,
+        team_name,
+        1,
+        "Div A",
+    )
+    finals = PlayoffRound("Finals", 16, (PlayoffBracket("Finals", 16, "Div A", [final]),))
+    challenges = tuple(
+        ChallengeResult(
+            challenge_name=name,
+            winner=team_name,
+            owner=owner,
+            division="Div A",
+            value=challenge_value,
+            description=f"{name} description",
+        )
+        for name in CHALLENGE_NAMES
+    )
+    return SeasonSummary(
+        year=2024,
+        generated_at="2025-01-05T12:00:00",
+        structure=structure,
+        regular_season=RegularSeasonSummary(structure, (champion,), (division,)),
+        season_challenges=challenges,
+        playoffs=PlayoffSummary(structure, (finals,)),
+        championship=None,
+    )
+
+
+@pytest.fixture
+def summary(structure: SeasonStructure, special_owner: Owner) -> SeasonSummary:
+    """Create a season summary with HTML special characters in names and values."""
+    return _make_summary(structure, special_owner, 'Tom & Jerry\'s <Team> "Q"', "<b>1500.50</b>")
+
+
+@pytest.fixture
+def plain_summary(structure: SeasonStructure) -> SeasonSummary:
+    """Create a second season summary with plain names and numeric values."""
+    owner = Owner(display_name="dave", first_name="Dave", last_name="Brown", id="d1")
+    return _make_summary(structure, owner, "Gridiron Giants", "1500.50")
+
+
+@pytest.fixture
+def missing_package_metadata(monkeypatch: pytest.MonkeyPatch) -> Iterator[list[str]]:
+    """Simulate a source checkout without installed package metadata."""
+    requested: list[str] = []
+
+    def raise_not_found(name: str) -> str:
+        requested.append(name)
+        raise PackageNotFoundError(name)
+
+    monkeypatch.setattr(base, "version", raise_not_found)
+    base._package_version.cache_clear()
+    yield requested
+    base._package_version.cache_clear()
+
+
+class TestSeasonRecapEmailFormatter:
+    """Tests for SeasonRecapEmailFormatter."""
+
+    def test_user_text_is_html_escaped(self, summary: SeasonSummary) -> None:
+        """Test team names, owner names, challenge values and the note are escaped."""
+        formatter = SeasonRecapEmailFormatter(
+            year=2024, format_args={"note": "Fees due <Friday> & after"}
+        )
+        html = formatter.format(summary)
+
+        assert "<td>Tom &amp; Jerry&#x27;s &lt;Team&gt; &quot;Q&quot;</td>" in html
+        assert "<td>Alice &amp; Bob &lt;Smith&gt;</td>" in html
+        assert "<td>&lt;b&gt;1500.50&lt;/b&gt;</td>" in html
+        assert "Fees due &lt;Friday&gt; &amp; after" in html
+
+        # No raw user text leaks into the markup
+        assert "<Team>" not in html
+        assert "<Smith>" not in html
+        assert "<b>1500.50</b>" not in html
+        assert "<Friday>" not in html
+
+    def test_format_to_matches_format(self, summary: SeasonSummary) -> None:
+        """Test format_to streams the same HTML as format."""
+        formatter = SeasonRecapEmailFormatter(year=2024, format_args={"note": "Test note"})
+
+        buffer = io.StringIO()
+        formatter.format_to(summary, buffer)
+
+        assert buffer.getvalue() == formatter.format(summary)
+
+    def test_format_many_matches_format(
+        self, summary: SeasonSummary, plain_summary: SeasonSummary
+    ) -> None:
+        """Test format_many yields one document per summary, in order."""
+        formatter = SeasonRecapEmailFormatter(year=2024, format_args={"note": "Test note"})
+
+        documents = list(formatter.format_many([summary, plain_summary]))
+
+        assert documents == [formatter.format(summary), formatter.format(plain_summary)]
+
+    def test_footer_without_package_metadata(
+        self, summary: SeasonSummary, missing_package_metadata: list[str]
+    ) -> None:
+        """Test the footer falls back to "unknown" when the package is not installed."""
+        html = SeasonRecapEmailFormatter(year=2024).format(summary)
+
+        assert missing_package_metadata == ["ff-awards"]
+        assert " vunknown" in html
+
+
+class TestSeasonRecapJsonFormatter:
+    """Tests for SeasonRecapJsonFormatter."""
+
+    @pytest.mark.parametrize("pretty", ["true", "false"])
+    def test_format_many_matches_format(
+        self, summary: SeasonSummary, plain_summary: SeasonSummary, pretty: str
+    ) -> None:
+        """Test format_many yields one JSON document per summary, in order."""
+        formatter = SeasonRecapJsonFormatter(year=2024, format_args={"pretty": pretty})
+
+        documents = list(formatter.format_many([summary, plain_summary]))
+
+        assert documents == [formatter.format(summary), formatter.format(plain_summary)]
+        assert ("\n" in documents[0]) is (pretty == "true")
+
+    @pytest.mark.parametrize(
+        "value", ["true", "TRUE", "1", "yes", "On", "false", "0", "no", "maybe"]
+    )
+    def test_bool_args_match_weekly_formatter(self, value: str) -> None:
+        """Test recap and weekly formatters accept the same boolean spellings."""
+        recap = SeasonRecapJsonFormatter(year=2024, format_args={"pretty": value})
+        weekly = JsonFormatter(year=2024, format_args={"pretty": value})
+
+        assert recap._get_arg_bool("pretty") is weekly._get_arg_bool("pretty")
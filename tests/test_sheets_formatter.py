@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import io
+
 import pytest
 
 from ff_tracker.display.sheets import SheetsFormatter
@@ -263,6 +265,32 @@ class TestFormatOutput:
         assert "Most Points Overall" in output
         assert output  # Non-empty output
 
+    def test_format_to_matches_format_output(
+        self,
+        sample_division: DivisionData,
+        sample_challenges: list[ChallengeResult],
+        sample_weekly_challenges: list[WeeklyChallenge],
+    ) -> None:
+        """Test format_to streams the same lines as format_output."""
+        formatter = SheetsFormatter(year=2024, format_args={"note": "Test note"})
+        output = formatter.format_output(
+            divisions=[sample_division],
+            challenges=sample_challenges,
+            weekly_challenges=sample_weekly_challenges,
+            current_week=10,
+        )
+
+        buffer = io.StringIO()
+        formatter.format_to(
+            divisions=[sample_division],
+            challenges=sample_challenges,
+            weekly_challenges=sample_weekly_challenges,
+            current_week=10,
+            out=buffer,
+        )
+
+        assert buffer.getvalue() == output + "\n"
+
 
 class TestTSVStructure:
     """Tests for TSV structure and formatting."""